@@ -1,4 +1,5 @@
 import os
 
 CONFIGS_DIR = os.path.join("src", "configs")
+RUNS_DB = os.path.join("src", "runs.sqlite3")  # База запусков (RunStore)
 os.makedirs(CONFIGS_DIR, exist_ok=True)
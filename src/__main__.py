@@ -0,0 +1,184 @@
+"""Запуск оптимизации без интерфейса: python -m src run <конфиг> [опции]
+
+Модули tkinter и matplotlib не импортируются, поэтому запуск работает на
+серверах без X-сервера. Движок импортируется только для команды run.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from environments import RUNS_DB
+
+
+def load_config(source: str, name: str | None = None) -> tuple[str, dict]:
+    """Имя и конфиг из JSON-файла или по имени из папки конфигураций
+
+    Файлы конфигураций хранят словарь {имя: конфиг}; без name берётся
+    единственный (первый) конфиг файла. Файл с самим конфигом тоже подходит,
+    его имя - путь к файлу.
+    """
+    if os.path.isfile(source):
+        with open(source, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if "components" in data:
+            return source, data
+        if name is None:
+            if not data:
+                raise ValueError(f"В файле {source} нет конфигураций")
+            name = next(iter(data))
+        if name not in data:
+            raise ValueError(f"В файле {source} нет конфигурации {name!r}")
+        return name, data[name]
+
+    from src.utils.config_manager import ConfigManager
+
+    name = name or source
+    config = ConfigManager().get_config(name)
+    if config is None:
+        raise ValueError(f"Конфигурация {source!r} не найдена")
+    return name, config
+
+
+def _json_default(value):
+    """Скаляры и массивы numpy в статистике запуска"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Нельзя записать в JSON: {type(value).__name__}")
+
+
+def write_result(path: str, result: dict) -> None:
+    """Результат в .npz (массивы) или в JSON (любое другое расширение)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    if path.endswith(".npz"):
+        import numpy as np
+
+        np.savez_compressed(
+            path,
+            best=np.asarray(result["best"], dtype=np.int32).reshape(-1, 3),
+            fitness=np.array(result["fitness"]),
+            fitness_list=np.asarray(result["fitness_list"], dtype=np.float64),
+            elapsed=np.array(result["elapsed"]),
+            engine=np.array(result["engine"]),
+            run_stats=np.array(json.dumps(result["run_stats"], default=_json_default)),
+        )
+        return
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(result, file, ensure_ascii=False, indent=4, default=_json_default)
+
+
+def run(args: argparse.Namespace) -> int:
+    from src.gen_alg.engines import create_engine
+    from src.utils.base_config import base_config
+
+    config_name, config = load_config(args.config, args.name)
+    config = dict(config)
+    overrides = {
+        "seed": args.seed,
+        "workers": args.workers,
+        "time_budget": args.time_budget,
+        "generations": args.generations,
+    }
+    config.update({key: value for key, value in overrides.items() if value is not None})
+    engine_name = args.engine or config.get("engine", base_config["engine"])
+
+    start = time.perf_counter()
+    engine = create_engine(config, engine_name)
+    recorder = None
+    if args.db:
+        from src.utils.run_store import RunStore
+
+        store = RunStore(args.db)
+        recorder = store.start_run(config, engine_name, config_name)
+        engine.recorder = recorder  # Движки без траектории пишут только итог
+    population, fitness_list = engine.run()
+    elapsed = time.perf_counter() - start
+    if recorder is not None:
+        recorder.finish(population, engine.run_stats, elapsed)
+        store.close()
+
+    best = min(population, key=lambda ind: ind.fitness.values[0])
+    result = {
+        "engine": engine_name,
+        "seed": config.get("seed", base_config["seed"]),
+        "fitness": best.fitness.values[0],
+        "best": [int(gene) for gene in best],
+        "fitness_list": list(fitness_list),
+        "elapsed": elapsed,
+        "run_stats": engine.run_stats,
+    }
+    if args.out:
+        write_result(args.out, result)
+    else:
+        json.dump(result, sys.stdout, ensure_ascii=False, default=_json_default)
+        sys.stdout.write("\n")
+    print(
+        f"Лучшая оценка: {result['fitness']:.2f} за {elapsed:.1f} с ({engine_name})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def runs(args: argparse.Namespace) -> int:
+    """Запуски из базы в JSON; с --trajectories - вместе с траекториями"""
+    from src.utils.run_store import RunStore
+
+    store = RunStore(args.db)
+    found = store.runs(args.name, args.config_hash, args.engine, args.limit)
+    if args.trajectories:
+        trajectories = store.trajectories([entry["id"] for entry in found])
+        for entry in found:
+            entry["trajectory"] = trajectories[entry["id"]]
+    store.close()
+    json.dump(found, sys.stdout, ensure_ascii=False, default=_json_default)
+    sys.stdout.write("\n")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src", description="Размещение компонентов на плате"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Запуск оптимизации по конфигу")
+    run_parser.add_argument("config", help="Путь к JSON-файлу или имя конфигурации")
+    run_parser.add_argument("--name", help="Имя конфигурации внутри файла")
+    run_parser.add_argument("--engine", help="Оптимизатор (по умолчанию из конфига)")
+    run_parser.add_argument("--seed", type=int, help="Сид генератора")
+    run_parser.add_argument("--workers", type=int, help="Процессов для оценки")
+    run_parser.add_argument(
+        "--time-budget", type=float, help="Ограничение времени в секундах"
+    )
+    run_parser.add_argument("--generations", type=int, help="Количество поколений")
+    run_parser.add_argument(
+        "--out", help="Файл результата: .npz или JSON (по умолчанию - stdout)"
+    )
+    run_parser.add_argument("--db", help="Записать запуск в базу запусков sqlite")
+    run_parser.set_defaults(handler=run)
+
+    runs_parser = commands.add_parser("runs", help="Запуски из базы запусков")
+    runs_parser.add_argument(
+        "--db", default=RUNS_DB, help=f"Файл базы (по умолчанию {RUNS_DB})"
+    )
+    runs_parser.add_argument("--name", help="Имя конфигурации")
+    runs_parser.add_argument("--config-hash", help="Хэш конфига")
+    runs_parser.add_argument("--engine", help="Оптимизатор")
+    runs_parser.add_argument("--limit", type=int, help="Не больше N последних")
+    runs_parser.add_argument(
+        "--trajectories", action="store_true", help="Добавить траектории"
+    )
+    runs_parser.set_defaults(handler=runs)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import random
+
+import numpy as np
+
+from src.gen_alg.problem import ProblemSpec
+from src.gen_alg.repair import Repairer
+
+SPREAD_ITERATIONS = 5  # Итераций "решение - растягивание" с ростом якорного веса
+TARGET_DENSITY = 0.7  # Заполнение области, по которой растягиваются компоненты
+PERTURBATION = 0.02  # Шум вариантов: доля стороны платы (стандартное отклонение)
+ROTATION_FLIP = 0.1  # Шанс поворота компонента в варианте
+DENSE_LIMIT = 400  # До этого числа компонентов спектральное начало - точное (eigh)
+SPECTRAL_ITERATIONS = 100  # Итераций степенного метода для спектрального начала
+CG_TOLERANCE = 1e-6  # Относительная невязка сопряжённых градиентов
+
+
+def laplacian(problem: ProblemSpec):
+    """Лапласиан графа соединений L = D - A (кратные связи складываются) без
+    плотной матрицы: степени и функция умножения L @ v за O(число связей)"""
+    n = problem.n_components
+    a, b = problem.conn_a, problem.conn_b
+    distinct = a != b  # Петли не влияют на длину связей
+    a, b = a[distinct], b[distinct]
+    degree = np.bincount(a, minlength=n) + np.bincount(b, minlength=n)
+
+    def matvec(v: np.ndarray) -> np.ndarray:
+        return (
+            degree * v
+            - np.bincount(a, weights=v[b], minlength=n)
+            - np.bincount(b, weights=v[a], minlength=n)
+        )
+
+    return degree.astype(float), matvec
+
+
+def conjugate_gradient(matvec, rhs: np.ndarray, start: np.ndarray) -> np.ndarray:
+    """Решение симметричной положительно определённой системы A x = rhs,
+    заданной умножением matvec, от начального приближения start"""
+    x = start.copy()
+    residual = rhs - matvec(x)
+    direction = residual.copy()
+    norm = residual @ residual
+    limit = (CG_TOLERANCE * np.linalg.norm(rhs)) ** 2
+    for _ in range(len(rhs)):
+        if norm <= limit:
+            break
+        product = matvec(direction)
+        step = norm / (direction @ product)
+        x += step * direction
+        residual -= step * product
+        norm, previous = residual @ residual, norm
+        direction = residual + norm / previous * direction
+    return x
+
+
+def spectral_vectors(degree: np.ndarray, matvec) -> np.ndarray:
+    """Собственные векторы 2 и 3 лапласиана (столбцы N x 2): точно для малых
+    задач, иначе блочным степенным методом для sigma I - L"""
+    n = len(degree)
+    if n <= DENSE_LIMIT:
+        matrix = np.column_stack([matvec(column) for column in np.eye(n)])
+        return np.linalg.eigh(matrix)[1][:, 1:3]
+    sigma = 2 * float(degree.max()) + 1  # Выше спектра L (оценка Гершгорина)
+    block = np.random.default_rng(0).standard_normal((n, 2))  # Не зависит от сида
+    for _ in range(SPECTRAL_ITERATIONS):
+        block -= block.mean(axis=0)  # Без постоянного вектора (собственный 1)
+        block, _ = np.linalg.qr(block)
+        block = sigma * block - np.column_stack(
+            [matvec(block[:, 0]), matvec(block[:, 1])]
+        )
+    return block
+
+
+def spread(centers: np.ndarray, sizes: np.ndarray, length: int) -> np.ndarray:
+    """Растягивание по оси: порядок компонентов сохраняется, а центры
+    распределяются по отрезку length пропорционально размерам"""
+    order = np.argsort(centers, kind="stable")
+    before = np.empty(len(centers))
+    before[order] = np.cumsum(sizes[order]) - sizes[order]  # Суммарный размер левее
+    total = max(float(sizes.sum()), 1.0)
+    free = np.maximum(length - sizes, 0)
+    return before / total * free + sizes / 2
+
+
+def quadratic_centers(problem: ProblemSpec) -> tuple[np.ndarray, np.ndarray]:
+    """Центры компонентов, минимизирующие квадратичную длину связей, растянутые
+    по центральной области платы с плотностью TARGET_DENSITY (как в SimPL:
+    чередование решения системы и растягивания)"""
+    n = problem.n_components
+    widths, heights = problem.widths.astype(float), problem.heights.astype(float)
+    side = (float((widths * heights).sum()) / TARGET_DENSITY) ** 0.5
+    region_w = min(problem.board_width, int(np.ceil(side)))
+    region_h = min(problem.board_height, int(np.ceil(side)))
+    offset_x = (problem.board_width - region_w) / 2
+    offset_y = (problem.board_height - region_h) / 2
+
+    def spread_xy(x, y):
+        return (
+            spread(x, widths, region_w) + offset_x,
+            spread(y, heights, region_h) + offset_y,
+        )
+
+    if n < 3:
+        return spread_xy(np.arange(n, dtype=float), np.arange(n, dtype=float))
+
+    # Спектральное начало: собственные векторы 2 и 3 минимизируют x^T L x
+    # при нормировке и ортогональности постоянному вектору
+    degree, matvec = laplacian(problem)
+    vectors = spectral_vectors(degree, matvec)
+    cx, cy = spread_xy(vectors[:, 0], vectors[:, 1])
+
+    # Якоря в растянутых позициях: (L + alpha I) c = alpha * spread(c);
+    # система разреженная, решается сопряжёнными градиентами от прошлого решения
+    alpha = max(0.1 * float(degree.mean()), 0.1)
+    for _ in range(SPREAD_ITERATIONS):
+
+        def system(v, alpha=alpha):
+            return matvec(v) + alpha * v
+
+        cx, cy = spread_xy(
+            conjugate_gradient(system, alpha * cx, cx),
+            conjugate_gradient(system, alpha * cy, cy),
+        )
+        alpha *= 2
+    return cx, cy
+
+
+def analytical_genomes(
+    problem: ProblemSpec, rng: random.Random, count: int
+) -> list[list[int]]:
+    """Геномы из аналитического решения: первый - без шума, остальные - варианты
+    со случайным сдвигом; каждый привязан к сетке и избавлен от пересечений"""
+    if count <= 0 or problem.n_components == 0:
+        return []
+    cx, cy = quadratic_centers(problem)
+    noise = np.random.default_rng(rng.getrandbits(64))
+    repairer = Repairer(problem)
+    sigma_x = PERTURBATION * problem.board_width
+    sigma_y = PERTURBATION * problem.board_height
+
+    genomes = []
+    for variant in range(count):
+        rotations = np.zeros(problem.n_components, dtype=np.int64)
+        x, y = cx, cy
+        if variant:
+            x = cx + noise.normal(0, sigma_x, problem.n_components)
+            y = cy + noise.normal(0, sigma_y, problem.n_components)
+            rotations = (noise.random(problem.n_components) < ROTATION_FLIP).astype(
+                np.int64
+            )
+        w, h = problem.sizes(rotations)
+        placements = np.stack(
+            [np.rint(x - w / 2), np.rint(y - h / 2), rotations], axis=1
+        ).astype(np.int64)
+        genome = placements.reshape(-1).tolist()
+        repairer.repair(genome)  # Прижимает к плате и разводит пересечения
+        genomes.append(genome)
+    return genomes
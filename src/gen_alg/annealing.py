@@ -0,0 +1,314 @@
+import math
+
+import numpy as np
+from deap import base, creator
+
+from src.gen_alg.collision import collision_engine
+from src.gen_alg.evaluation import (
+    OUT_OF_BOARD_PENALTY,
+    OVERLAP_PENALTY,
+    evaluate_population,
+)
+from src.gen_alg.problem import ProblemSpec
+from src.gen_alg.repair import position_bounds
+from src.gen_alg.rng import make_rng
+from src.gen_alg.seeding import pack_layout
+from src.gen_alg.stopping import StoppingCriteria
+from src.utils.base_config import base_config
+
+INITIAL_ACCEPTANCE = 0.8  # Доля принимаемых ухудшений при начальной температуре
+TARGET_ACCEPTANCE = 0.44  # Доля принятых ходов, к которой подстраивается окно сдвига
+MIN_TEMPERATURE = 1e-9  # Ниже этой температуры ухудшения не принимаются
+REFINE_ACCEPTANCE = 0.05  # Доля ухудшений при старте от готовой раскладки
+REFINE_WINDOW = 4  # Начальное окно сдвига при старте от готовой раскладки
+
+
+class SimulatedAnnealing:
+    """Имитация отжига над одной раскладкой с инкрементальной стоимостью ходов
+
+    Конфиг и результат те же, что у GeneticAlgorithm: поколение - одна эпоха
+    при постоянной температуре, популяция - лучшая найденная раскладка
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.problem = ProblemSpec.from_config(config)
+        self.collision = collision_engine(config)
+        self.rng = make_rng(config)
+        self.moves_per_epoch = (
+            config.get("anneal_moves", base_config["anneal_moves"])
+            or 10 * self.problem.n_components
+        )
+        max_x, max_y = position_bounds(self.problem)
+        self.max_x, self.max_y = np.array(max_x), np.array(max_y)
+        self.incident = [
+            self.problem.adjacency[
+                self.problem.adjacency_ptr[c] : self.problem.adjacency_ptr[c + 1]
+            ]
+            for c in range(self.problem.n_components)
+        ]  # Соединения каждого компонента
+        self.evaluations = 0
+        self.run_stats = {}
+        self.cancel = None  # Событие отмены запуска (threading.Event)
+        self.recorder = None  # RunRecorder или LiveFeed: лучшее и текущее по эпохам
+
+        if not hasattr(creator, "FitnessMin"):
+            creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+        if not hasattr(creator, "Individual"):
+            creator.create("Individual", list, fitness=creator.FitnessMin)
+
+    def initial_layout(self) -> np.ndarray:
+        """Стартовая раскладка от упаковщика либо случайная в пределах платы"""
+        order = self.config.get("seeding_order", base_config["seeding_order"])
+        genome = pack_layout(self.problem, self.rng, order)
+        if genome is not None:
+            return np.array(genome, dtype=np.int64).reshape(-1, 3)
+        placements = np.zeros((self.problem.n_components, 3), dtype=np.int64)
+        for c in range(self.problem.n_components):
+            rot = self.rng.randint(0, 1)
+            placements[c] = (
+                self.rng.randint(0, int(self.max_x[rot, c])),
+                self.rng.randint(0, int(self.max_y[rot, c])),
+                rot,
+            )
+        return placements
+
+    def clamp(self, placements) -> np.ndarray:
+        """Копия раскладки с координатами в пределах платы для своего поворота:
+        окна сдвига в _propose строятся от текущих координат"""
+        placements = np.array(placements, dtype=np.int64).reshape(-1, 3)
+        rot = (placements[:, 2] != 0).astype(np.int64)
+        components = np.arange(self.problem.n_components)
+        placements[:, 0] = np.clip(placements[:, 0], 0, self.max_x[rot, components])
+        placements[:, 1] = np.clip(placements[:, 1], 0, self.max_y[rot, components])
+        placements[:, 2] = rot
+        return placements
+
+    def _load(self, placements: np.ndarray) -> None:
+        """Состояние раскладки и слагаемые стоимости по компонентам и соединениям"""
+        self.x = placements[:, 0].copy()
+        self.y = placements[:, 1].copy()
+        self.rot = (placements[:, 2] != 0).astype(np.int64)
+        self.w, self.h = self.problem.sizes(self.rot)
+        self.w, self.h = self.w.copy(), self.h.copy()
+        self.lengths = self._lengths(np.arange(self.problem.n_connections))
+        self.out = self._out_of_board(np.arange(self.problem.n_components))
+        pairs = sum(self._overlaps_with([c]) for c in range(self.problem.n_components))
+        self.overlaps = pairs // 2
+
+    def _lengths(self, connections: np.ndarray) -> np.ndarray:
+        """Длины соединений по текущим координатам"""
+        a, b = self.problem.conn_a[connections], self.problem.conn_b[connections]
+        dx = (self.x[a] + self.w[a] / 2) - (self.x[b] + self.w[b] / 2)
+        dy = (self.y[a] + self.h[a] / 2) - (self.y[b] + self.h[b] / 2)
+        return (dx**2 + dy**2) ** 0.5
+
+    def _out_of_board(self, components) -> np.ndarray:
+        """Флаги выхода компонентов за плату"""
+        return (self.x[components] + self.w[components] > self.problem.board_width) | (
+            self.y[components] + self.h[components] > self.problem.board_height
+        )
+
+    def _overlaps_with(self, components: list) -> int:
+        """Пары с пересечением, где участвует хотя бы один из компонентов"""
+        if len(components) == 1:  # Частый случай: скаляр против массивов
+            c = components[0]
+            xc, yc, wc, hc = (
+                int(self.x[c]),
+                int(self.y[c]),
+                int(self.w[c]),
+                int(self.h[c]),
+            )
+            overlapping = (
+                (self.x < xc + wc)
+                & (xc < self.x + self.w)
+                & (self.y < yc + hc)
+                & (yc < self.y + self.h)
+            )
+            overlapping[c] = False  # Сам с собой
+            return int(np.count_nonzero(overlapping))
+        idx = np.array(components)
+        xi, yi = self.x[idx, None], self.y[idx, None]
+        wi, hi = self.w[idx, None], self.h[idx, None]
+        overlapping = ~(
+            (xi + wi <= self.x)
+            | (self.x + self.w <= xi)
+            | (yi + hi <= self.y)
+            | (self.y + self.h <= yi)
+        )
+        overlapping[np.arange(len(idx)), idx] = False  # Сам с собой
+        inner = int(np.count_nonzero(overlapping[:, idx]))  # Пары внутри - дважды
+        return int(np.count_nonzero(overlapping)) - inner // 2
+
+    def _propose(self, limit: int) -> list[tuple]:
+        """Случайный ход: список (компонент, x, y, поворот) после хода"""
+        n = self.problem.n_components
+        c = self.rng.randrange(n)
+        kind = self.rng.random()
+        if kind < 0.6 or n == 1:  # Сдвиг в окне limit
+            rot = int(self.rot[c])
+            x = self.rng.randint(
+                max(0, self.x[c] - limit), min(self.max_x[rot, c], self.x[c] + limit)
+            )
+            y = self.rng.randint(
+                max(0, self.y[c] - limit), min(self.max_y[rot, c], self.y[c] + limit)
+            )
+            return [(c, x, y, rot)]
+        if kind < 0.8:  # Поворот
+            rot = 1 - int(self.rot[c])
+            x = min(int(self.x[c]), int(self.max_x[rot, c]))
+            y = min(int(self.y[c]), int(self.max_y[rot, c]))
+            return [(c, x, y, rot)]
+        other = self.rng.randrange(n - 1)  # Обмен позициями
+        other += other >= c
+        moves = []
+        for first, second in ((c, other), (other, c)):
+            rot = int(self.rot[first])
+            moves.append(
+                (
+                    first,
+                    min(int(self.x[second]), int(self.max_x[rot, first])),
+                    min(int(self.y[second]), int(self.max_y[rot, first])),
+                    rot,
+                )
+            )
+        return moves
+
+    def _apply(self, moves: list[tuple]) -> list[tuple]:
+        """Запись координат компонентов; возвращает ход для отката"""
+        undo = []
+        for c, x, y, rot in moves:
+            undo.append((c, int(self.x[c]), int(self.y[c]), int(self.rot[c])))
+            self.x[c], self.y[c], self.rot[c] = x, y, rot
+            self.w[c] = self.problem.rotated_widths[rot, c]
+            self.h[c] = self.problem.rotated_heights[rot, c]
+        return undo
+
+    def try_move(self, moves: list[tuple], temperature: float) -> bool:
+        """Оценка хода по изменённым слагаемым и решение Метрополиса"""
+        components = [move[0] for move in moves]
+        if len(components) == 1:
+            connections = self.incident[components[0]]
+        else:
+            connections = np.unique(
+                np.concatenate([self.incident[c] for c in components])
+            )
+
+        old_overlaps = self._overlaps_with(components)
+        old_out = int(np.count_nonzero(self.out[components]))
+        old_length = self.lengths[connections].sum()
+
+        undo = self._apply(moves)
+        new_overlaps = self._overlaps_with(components)
+        new_out = self._out_of_board(components)
+        new_lengths = self._lengths(connections)
+        self.evaluations += 1
+
+        penalty = (new_overlaps - old_overlaps) * OVERLAP_PENALTY + (
+            int(np.count_nonzero(new_out)) - old_out
+        ) * OUT_OF_BOARD_PENALTY
+        delta = new_lengths.sum() - old_length + penalty
+        self.last_delta = delta if not penalty else None  # Для начальной температуры
+        if delta <= 0 or (
+            temperature > MIN_TEMPERATURE
+            and self.rng.random() < math.exp(-delta / temperature)
+        ):
+            self.lengths[connections] = new_lengths
+            self.out[components] = new_out
+            self.overlaps += new_overlaps - old_overlaps
+            self.cost += delta
+            return True
+        self._apply(undo)
+        return False
+
+    def initial_temperature(self, limit: int) -> float:
+        """Температура, при которой среднее ухудшение пробных ходов принимается
+        с шансом self.acceptance; улучшающие пробные ходы сохраняются"""
+        uphill = []
+        for _ in range(self.moves_per_epoch):
+            accepted = self.try_move(self._propose(limit), 0.0)  # Только улучшения
+            # Ходы, меняющие штрафы, не учитываются: иначе температура порядка
+            # OVERLAP_PENALTY разрушает стартовую раскладку без пересечений
+            if not accepted and self.last_delta is not None:
+                uphill.append(self.last_delta)
+        if not uphill:
+            return MIN_TEMPERATURE
+        return -float(np.mean(uphill)) / math.log(self.acceptance)
+
+    def layout(self) -> np.ndarray:
+        """Текущая раскладка в виде матрицы N x 3"""
+        return np.stack([self.x, self.y, self.rot], axis=1)
+
+    def exact_cost(self, placements: np.ndarray) -> float:
+        """Точная оценка раскладки тем же вычислителем, что и у ГА"""
+        return float(
+            evaluate_population(self.problem, placements[None], self.collision)[0]
+        )
+
+    def run(self, start: np.ndarray | None = None) -> tuple[list, list]:
+        """Отжиг от раскладки start (N x 3) либо от initial_layout(); компоненты
+        start за пределами платы сначала переносятся на её край"""
+        if self.problem.n_components == 0:
+            raise ValueError(
+                "Нет компонентов для размещения. Добавьте компоненты в конфигурацию."
+            )
+        self.evaluations = 0
+        self.last_delta = None  # Изменение длины связей последним ходом без штрафов
+        vis_steps = self.config.get("visualization_steps", [])
+        fitness_list = []
+
+        stopping = StoppingCriteria(self.config, self.cancel)
+        self._load(self.initial_layout() if start is None else self.clamp(start))
+        self.cost = self.exact_cost(self.layout())
+        best, best_cost = self.layout(), self.cost
+        limit = max(self.problem.board_width, self.problem.board_height)
+        self.acceptance = INITIAL_ACCEPTANCE
+        if start is not None:  # Уточнение: готовую раскладку не разрушаем
+            self.acceptance = REFINE_ACCEPTANCE
+            limit = min(limit, REFINE_WINDOW)
+        temperature = self.initial_temperature(limit)
+
+        for epoch in range(0, self.config["generations"] + 1):
+            self.cost = self.exact_cost(
+                self.layout()
+            )  # Без накопления ошибки округления
+            accepted = 0
+            for _ in range(self.moves_per_epoch):
+                accepted += self.try_move(self._propose(limit), temperature)
+                if self.cost < best_cost:
+                    best, best_cost = self.layout(), self.cost
+            acceptance = accepted / self.moves_per_epoch
+
+            # Адаптивное охлаждение по доле принятых ходов; окно сдвига
+            # подстраивается так, чтобы принималась примерно TARGET_ACCEPTANCE
+            if acceptance > 0.96:
+                temperature *= 0.5
+            elif acceptance > 0.8:
+                temperature *= 0.9
+            elif acceptance > 0.15:
+                temperature *= 0.95
+            else:
+                temperature *= 0.8
+            limit = int(
+                min(
+                    max(limit * (1 - TARGET_ACCEPTANCE + acceptance), 1),
+                    max(self.problem.board_width, self.problem.board_height),
+                )
+            )
+
+            best_cost = self.exact_cost(best)
+            if epoch in vis_steps:
+                fitness_list.append(best_cost)
+            if self.recorder is not None:
+                self.recorder.record(epoch, best_cost, self.cost)
+            if stopping.check(epoch, best_cost):
+                break
+
+        individual = creator.Individual(best.reshape(-1).tolist())
+        individual.fitness.values = (best_cost,)
+        self.run_stats = {
+            "evaluations": self.evaluations,
+            **stopping.stats(),
+            "temperature": temperature,
+        }
+        return [individual], fitness_list
@@ -0,0 +1,179 @@
+import numpy as np
+from deap import base, creator
+
+from src.gen_alg.collision import collision_engine
+from src.gen_alg.evaluation import evaluate_population
+from src.gen_alg.problem import ProblemSpec
+from src.gen_alg.repair import position_bounds
+from src.gen_alg.stopping import StoppingCriteria
+from src.utils.base_config import base_config
+
+
+class ArrayGeneticAlgorithm:
+    """ГА над популяцией-матрицей (P x 3N) с векторизованными операторами"""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.problem = ProblemSpec.from_config(config)
+        self.collision = collision_engine(config)
+        self.rng = np.random.default_rng(config.get("seed", base_config["seed"]))
+        self.tournsize = 3
+        self.indpb = base_config["indpb"]  # Как в genetic_algorithm_new
+        self.up = max(self.problem.board_width, self.problem.board_height) - 1
+        self.bounded = (
+            config.get("mutation", base_config["mutation"]) == "bounded"
+        )  # Границы генов по размерам компонента либо общая граница платы
+        max_x, max_y = position_bounds(self.problem)
+        self.max_x = np.array(max_x)  # (2, N): наибольший x по значению поворота
+        self.max_y = np.array(max_y)
+        self.evaluations = 0
+        self.run_stats = {}
+        self.cancel = None  # Событие отмены запуска (threading.Event)
+        self.recorder = None  # RunRecorder или LiveFeed: точки каждого поколения
+
+        if not hasattr(creator, "FitnessMin"):
+            creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+        if not hasattr(creator, "Individual"):
+            creator.create("Individual", list, fitness=creator.FitnessMin)
+
+    def init_population(self, size: int) -> np.ndarray:
+        """Случайная популяция: сначала поворот, затем координаты в пределах
+        платы по размерам повёрнутого компонента"""
+        population = np.empty((size, self.problem.n_components, 3), dtype=np.int64)
+        rotations = self.rng.integers(0, 2, size=population.shape[:2])
+        components = np.arange(self.problem.n_components)
+        population[:, :, 0] = self.rng.integers(
+            0, self.max_x[rotations, components] + 1
+        )
+        population[:, :, 1] = self.rng.integers(
+            0, self.max_y[rotations, components] + 1
+        )
+        population[:, :, 2] = rotations
+        return population.reshape(size, -1)
+
+    def evaluate(self, population: np.ndarray) -> np.ndarray:
+        """Оценка строк матрицы популяции"""
+        self.evaluations += len(population)
+        if not len(population):
+            return np.empty(0)
+        return evaluate_population(self.problem, population, self.collision)
+
+    def select(self, fitness: np.ndarray, k: int) -> np.ndarray:
+        """Турнирный отбор: индексы победителей k турниров по tournsize участников"""
+        aspirants = self.rng.integers(0, len(fitness), size=(k, self.tournsize))
+        return aspirants[np.arange(k), np.argmin(fitness[aspirants], axis=1)]
+
+    def crossover(self, population: np.ndarray, cxpb: float) -> np.ndarray:
+        """Двухточечный кроссовер соседних пар строк; возвращает маску изменённых строк"""
+        n_pairs = len(population) // 2
+        length = population.shape[1]
+        changed = np.zeros(len(population), dtype=bool)
+        if n_pairs == 0 or length < 2:
+            return changed
+
+        mating = self.rng.random(n_pairs) < cxpb
+        point1 = self.rng.integers(1, length + 1, size=n_pairs)
+        point2 = self.rng.integers(1, length, size=n_pairs)
+        point2 = np.where(point2 >= point1, point2 + 1, point2)
+        low, high = np.minimum(point1, point2), np.maximum(point1, point2)
+
+        genes = np.arange(length)
+        swap = (genes >= low[:, None]) & (genes < high[:, None]) & mating[:, None]
+        first = population[0 : 2 * n_pairs : 2]
+        second = population[1 : 2 * n_pairs : 2]
+        first_copy = first.copy()
+        first[swap] = second[swap]
+        second[swap] = first_copy[swap]
+
+        changed[0 : 2 * n_pairs : 2] = mating
+        changed[1 : 2 * n_pairs : 2] = mating
+        return changed
+
+    def mutate(self, population: np.ndarray, mutpb: float) -> np.ndarray:
+        """Мутация генов и поворота по config["mutation"]; возвращает маску мутантов"""
+        mutants = self.rng.random(len(population)) < mutpb
+        if self.bounded:
+            self.mutate_bounded(population, mutants)
+            return mutants
+
+        uniform = (self.rng.random(population.shape) < self.indpb) & mutants[:, None]
+        values = self.rng.integers(0, self.up + 1, size=population.shape)
+        population[uniform] = values[uniform]
+
+        rotations = population[:, 2::3]
+        flips = (self.rng.random(rotations.shape) < self.indpb) & mutants[:, None]
+        rotations[flips] = 1 - rotations[flips]  # Срез - представление, меняет матрицу
+        return mutants
+
+    def mutate_bounded(self, population: np.ndarray, mutants: np.ndarray) -> None:
+        """Векторный аналог mut_bounded_int и mut_rotation_bounded: координаты
+        в пределах платы с учётом поворота, при повороте - сдвиг внутрь платы"""
+        xs, ys, rotations = (
+            population[:, 0::3],
+            population[:, 1::3],
+            population[:, 2::3],
+        )
+        components = np.arange(self.problem.n_components)
+
+        for genes, bounds in ((xs, self.max_x), (ys, self.max_y)):
+            high = bounds[(rotations != 0).astype(np.intp), components]
+            mutate = (self.rng.random(genes.shape) < self.indpb) & mutants[:, None]
+            values = self.rng.integers(0, high + 1)
+            genes[mutate] = values[mutate]
+
+        flips = (self.rng.random(rotations.shape) < self.indpb) & mutants[:, None]
+        rotations[flips] = 1 - (rotations[flips] != 0)
+        rotated = (rotations != 0).astype(np.intp)
+        np.clip(xs, 0, self.max_x[rotated, components], out=xs, where=flips)
+        np.clip(ys, 0, self.max_y[rotated, components], out=ys, where=flips)
+
+    def next_generation(self, population: np.ndarray, fitness: np.ndarray) -> tuple:
+        """Одно поколение над всей матрицей без копирования отдельных особей"""
+        parents = self.select(fitness, len(population))
+        offspring = population[parents]  # Продвинутая индексация - уже копия
+        offspring_fitness = fitness[parents]
+
+        changed = self.crossover(offspring, self.config["cxpb"])
+        changed |= self.mutate(offspring, self.config["mutpb"])
+        offspring_fitness[changed] = self.evaluate(offspring[changed])
+        return offspring, offspring_fitness
+
+    def to_individuals(self, population: np.ndarray, fitness: np.ndarray) -> list:
+        """Перевод матрицы популяции в список creator.Individual для совместимости с DEAP"""
+        individuals = []
+        for genome, fit in zip(population.tolist(), fitness.tolist()):
+            ind = creator.Individual(genome)
+            ind.fitness.values = (fit,)
+            individuals.append(ind)
+        return individuals
+
+    def run(self) -> tuple[list, list]:
+        if self.problem.n_components == 0:
+            raise ValueError(
+                "Нет компонентов для размещения. Добавьте компоненты в конфигурацию."
+            )
+        self.evaluations = 0
+        vis_steps = self.config.get("visualization_steps", [])
+        fitness_list = []
+
+        stopping = StoppingCriteria(self.config, self.cancel)
+        population = self.init_population(self.config["population_size"])
+        fitness = self.evaluate(population)
+
+        for generation in range(0, self.config["generations"] + 1):
+            population, fitness = self.next_generation(population, fitness)
+            if generation in vis_steps:
+                fitness_list.append(fitness.min())
+            if self.recorder is not None:
+                self.recorder.record(
+                    generation,
+                    fitness.min(),
+                    fitness.mean(),
+                    fitness.max(),
+                    float(population.std(axis=0).mean()),
+                )
+            if stopping.check(generation, fitness.min()):
+                break
+
+        self.run_stats = {"evaluations": self.evaluations, **stopping.stats()}
+        return self.to_individuals(population, fitness), fitness_list
@@ -0,0 +1,229 @@
+import random
+import time
+
+import numpy as np
+
+from src.gen_alg.collision import count_overlaps_brute, count_overlaps_sweep
+from src.gen_alg.engines import create_engine
+from src.gen_alg.evaluation import evaluate_population
+from src.gen_alg.genetic_algorithm_new import GeneticAlgorithm
+from src.gen_alg.jit_kernels import NUMBA_AVAILABLE
+from src.gen_alg.problem import ProblemSpec
+from src.utils.base_config import base_config
+
+
+def random_config(n_components: int, n_connections: int = None, rng=None) -> dict:
+    """Случайная конфигурация платы для замеров"""
+    rng = rng or random.Random(0)
+    n_connections = 2 * n_components if n_connections is None else n_connections
+    x, y, w, h = random_layout(n_components, rng=rng)
+    side = int(max((x + w).max(), (y + h).max()))
+    return {
+        "board_width": side,
+        "board_height": side,
+        "population_size": 50,
+        "generations": 100,
+        "visualization_steps": [],
+        "cxpb": 0.7,
+        "mutpb": 0.2,
+        "components": [{"width": int(cw), "height": int(ch)} for cw, ch in zip(w, h)],
+        "connections": [
+            [rng.randrange(n_components), rng.randrange(n_components)]
+            for _ in range(n_connections)
+        ],
+    }
+
+
+def random_layout(n_components: int, density: float = 0.5, rng=None) -> tuple:
+    """Случайное размещение N компонентов 1..5 x 1..5 на плате с заданной плотностью"""
+    rng = rng or random.Random(0)
+    w = np.array([rng.randint(1, 5) for _ in range(n_components)])
+    h = np.array([rng.randint(1, 5) for _ in range(n_components)])
+    side = max(5, int(((w * h).sum() / density) ** 0.5))  # Сторона платы под плотность
+    x = np.array([rng.randint(0, side - 1) for _ in range(n_components)])
+    y = np.array([rng.randint(0, side - 1) for _ in range(n_components)])
+    return x, y, w, h
+
+
+def best_time(func, *args, repeats: int = 5) -> float:
+    """Минимальное время выполнения функции из нескольких повторов"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def collision_crossover(sizes=None, repeats: int = 5, log=print) -> int | None:
+    """Сравнение brute/sweep по числу компонентов; возвращает N, с которого sweep быстрее"""
+    sizes = sizes or [10, 25, 50, 100, 200, 400, 800, 1600, 3200]
+    crossover = None
+    log(f"{'N':>6} {'brute, мс':>12} {'sweep, мс':>12} {'ускорение':>10}")
+    for n in sizes:
+        layout = random_layout(n)
+        if count_overlaps_brute(*layout) != count_overlaps_sweep(*layout):
+            raise AssertionError(f"brute и sweep расходятся при N = {n}")
+        brute = best_time(count_overlaps_brute, *layout, repeats=repeats)
+        sweep = best_time(count_overlaps_sweep, *layout, repeats=repeats)
+        if sweep < brute and crossover is None:
+            crossover = n
+        elif sweep >= brute:
+            crossover = None  # Точка пересечения - после последнего проигрыша sweep
+        log(f"{n:>6} {brute * 1e3:>12.3f} {sweep * 1e3:>12.3f} {brute / sweep:>9.1f}x")
+    log(f"Sweep быстрее перебора начиная с N = {crossover}")
+    return crossover
+
+
+def delta_equivalence(trials: int = 200, rng=None, log=print) -> None:
+    """Рандомизированная проверка: инкрементальная оценка после каждого оператора
+    изменчивости совпадает с полной; при расхождении - AssertionError"""
+    rng = rng or random.Random(0)
+    for trial in range(trials):
+        config = random_config(rng.randint(1, 60), rng=rng)
+        config["delta_evaluation"] = True
+        config["collision"] = rng.choice(["brute", "sweep"])
+        config["mutation"] = rng.choice(["bounded", "uniform"])
+        ga = GeneticAlgorithm(config)
+        population = ga.toolbox.population(n=6)
+        ga.evaluate_all(population)
+        for _ in range(10):
+            for operator in ("mate", "mutate", "mutate_rotation"):
+                offspring = list(map(ga.toolbox.clone, population))
+                if operator == "mate":
+                    for child1, child2 in zip(offspring[::2], offspring[1::2]):
+                        ga.toolbox.mate(child1, child2)
+                else:
+                    for mutant in offspring:
+                        getattr(ga.toolbox, operator)(mutant)
+                for ind, fit in zip(offspring, ga.evaluate_all(offspring)):
+                    expected = ga.evaluate(ind)
+                    if fit != expected:
+                        raise AssertionError(
+                            f"Расхождение после {operator} в испытании {trial}:"
+                            f" {fit[0]} != {expected[0]}"
+                        )
+                population = offspring
+    log(f"Инкрементальная оценка совпала с полной в {trials} испытаниях")
+
+
+def seed_reproducibility(seeds=(0, 1, 2), log=print) -> None:
+    """Проверка: запуск с одним сидом повторяется при любом состоянии глобальных
+    random и numpy, то есть вся случайность ГА идёт из генератора запуска;
+    при расхождении - AssertionError"""
+    from src.gen_alg.genetic_algorithm import GeneticAlgorithm as GuiGeneticAlgorithm
+
+    backends = ("python", "numba") if NUMBA_AVAILABLE else ("python",)
+    config = dict(random_config(30), generations=20)
+    for engine_class in (GeneticAlgorithm, GuiGeneticAlgorithm):
+        for backend in backends:
+            for mutation in ("bounded", "uniform"):
+                for seed in seeds:
+                    # Оба экземпляра создаются до запусков: общий для процесса
+                    # генератор numba не должен влиять на результат
+                    engines = [
+                        engine_class(
+                            dict(config, seed=seed, mutation=mutation, backend=backend)
+                        )
+                        for _ in range(2)
+                    ]
+                    runs = []
+                    for noise, ga in enumerate(engines, start=1):
+                        random.seed(noise)  # Разное состояние глобальных генераторов
+                        np.random.seed(noise)
+                        runs.append([list(ind) for ind in ga.run()[0]])
+                    if runs[0] != runs[1]:
+                        raise AssertionError(
+                            f"{engine_class.__module__}: запуск с seed={seed},"
+                            f" backend={backend} и mutation={mutation} зависит"
+                            " от глобального состояния генераторов"
+                        )
+    log(
+        f"Запуски с одинаковым сидом совпали ({len(seeds)} сида, оба класса ГА,"
+        f" реализации: {', '.join(backends)})"
+    )
+
+
+def penalty_free_share(problem: ProblemSpec, population: list) -> float:
+    """Доля особей без пересечений и выхода за плату"""
+    no_connections = np.empty(0, dtype=np.int64)
+    layout_only = ProblemSpec.from_arrays(
+        problem.board_width,
+        problem.board_height,
+        problem.widths,
+        problem.heights,
+        no_connections,
+        no_connections,
+    )  # Без связей оценка состоит только из штрафов
+    return float(np.mean(evaluate_population(layout_only, population) == 0))
+
+
+def seeding_effect(sizes=None, generations: int = 200, log=print) -> None:
+    """Начальная популяция со стартовой упаковкой и без неё: поколение 0
+    того же запуска, что и итог"""
+    sizes = sizes or [10, 30, 80]
+    log(
+        f"{'N':>4} {'доля':>6} {'лучшее, 0':>11} {'лучшее, G':>11}"
+        f" {'легальных, 0':>13} {'легальных, G':>13}"
+    )
+    for n in sizes:
+        config = random_config(n)
+        for fraction in (0.0, base_config["seeding_fraction"]):
+            ga = GeneticAlgorithm(
+                dict(config, seeding_fraction=fraction, generations=generations)
+            )
+            initial = []  # Копия популяции, с которой стартует run()
+
+            def init_population(size, init=ga.init_population, initial=initial):
+                population = init(size)
+                initial.extend(list(ind) for ind in population)
+                return population
+
+            ga.init_population = init_population
+            population, _ = ga.run()
+            first = float(
+                evaluate_population(ga.problem, np.array(initial), ga.collision).min()
+            )
+            last = min(ind.fitness.values[0] for ind in population)
+            log(
+                f"{n:>4} {fraction:>6.2f} {first:>11.0f} {last:>11.0f}"
+                f" {penalty_free_share(ga.problem, initial):>13.2f}"
+                f" {penalty_free_share(ga.problem, population):>13.2f}"
+            )
+
+
+def engine_comparison(
+    sizes=None, engines=("ga", "array", "annealing"), time_budget=5.0, log=print
+) -> dict:
+    """Лучшая оценка движков при одинаковом бюджете времени на задачу"""
+    sizes = sizes or [30, 80]
+    results = {}
+    log(f"{'N':>4} {'движок':>10} {'лучшее':>10} {'оценок':>9} {'эпох':>6}")
+    for n in sizes:
+        config = random_config(n)
+        config.update(generations=10**9, time_budget=time_budget)
+        for name in engines:
+            engine = create_engine(config, name)
+            population, _ = engine.run()
+            best = min(ind.fitness.values[0] for ind in population)
+            results[n, name] = best
+            log(
+                f"{n:>4} {name:>10} {best:>10.1f} {engine.run_stats['evaluations']:>9}"
+                f" {engine.run_stats['generations']:>6}"
+            )
+    return results
+
+
+BENCHMARKS = {
+    "collision_crossover": collision_crossover,
+    "delta_equivalence": delta_equivalence,
+    "seed_reproducibility": seed_reproducibility,
+    "seeding_effect": seeding_effect,
+    "engine_comparison": engine_comparison,
+}  # Имена для запуска из командной строки
+
+if __name__ == "__main__":
+    import sys
+
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+
+import numpy as np
+
+from src.utils.file_mode import replacement_mode
+
+CHECKPOINT_VERSION = 2  # 2 - с хэшем задачи
+
+
+def pack_random_state(state: tuple) -> dict:
+    """Состояние random.getstate() в виде массивов для npz"""
+    version, internal, gauss_next = state
+    return {
+        "rng_version": np.array(version),
+        "rng_internal": np.array(internal, dtype=np.uint64),
+        "rng_gauss": np.array(np.nan if gauss_next is None else gauss_next),
+    }
+
+
+def unpack_random_state(data) -> tuple:
+    """Обратное преобразование для random.setstate()"""
+    gauss_next = float(data["rng_gauss"])
+    return (
+        int(data["rng_version"]),
+        tuple(int(v) for v in data["rng_internal"]),
+        None if np.isnan(gauss_next) else gauss_next,
+    )
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    """Атомарная запись контрольной точки: временный файл, fsync и переименование;
+    права файла сохраняются"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        os.fchmod(fd, replacement_mode(path))
+        with os.fdopen(fd, "wb") as file:
+            np.savez_compressed(
+                file,
+                version=np.array(CHECKPOINT_VERSION),
+                problem_hash=np.array(state["problem_hash"]),
+                genomes=np.asarray(state["genomes"], dtype=np.int32),
+                fitness=np.asarray(state["fitness"], dtype=np.float64),
+                generation=np.array(state["generation"]),
+                fitness_list=np.asarray(state["fitness_list"], dtype=np.float64),
+                evaluations=np.array(state["evaluations"]),
+                elapsed=np.array(state["elapsed"]),
+                best=np.array(state["best"]),
+                last_improvement=np.array(state["last_improvement"]),
+                **pack_random_state(state["random_state"]),
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str, problem_hash: str | None = None) -> dict:
+    """Чтение контрольной точки, записанной save_checkpoint; с problem_hash -
+    отказ, если точка сохранена для другой задачи (плата, компоненты, связи)"""
+    with np.load(path) as data:
+        if int(data["version"]) != CHECKPOINT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия контрольной точки: {path}")
+        if problem_hash is not None and str(data["problem_hash"]) != problem_hash:
+            raise ValueError(
+                f"Контрольная точка {path} сохранена для другой задачи:"
+                " плата, компоненты или соединения отличаются"
+            )
+        return {
+            "problem_hash": str(data["problem_hash"]),
+            "genomes": data["genomes"].astype(np.int64),
+            "fitness": data["fitness"],
+            "generation": int(data["generation"]),
+            "fitness_list": data["fitness_list"].tolist(),
+            "evaluations": int(data["evaluations"]),
+            "elapsed": float(data["elapsed"]),
+            "best": float(data["best"]),
+            "last_improvement": int(data["last_improvement"]),
+            "random_state": unpack_random_state(data),
+        }
@@ -0,0 +1,82 @@
+import numpy as np
+
+from src.utils.base_config import base_config
+
+COLLISION_ENGINES = ("brute", "sweep")  # Допустимые значения ключа "collision"
+
+
+def count_overlaps_brute(x, y, w, h) -> int:
+    """Количество пересекающихся пар прямоугольников полным перебором O(N²)"""
+    x, y, w, h = (np.asarray(v, dtype=np.int64) for v in (x, y, w, h))
+    separated = (
+        (x[:, None] + w[:, None] <= x[None, :])
+        | (x[None, :] + w[None, :] <= x[:, None])
+        | (y[:, None] + h[:, None] <= y[None, :])
+        | (y[None, :] + h[None, :] <= y[:, None])
+    )
+    return int(np.count_nonzero(np.triu(~separated, k=1)))
+
+
+def _sweep(x, y, w, h):
+    """Sort-and-sweep по интервалам X: порядок сортировки, кандидатные пары
+    (i, j) в отсортированных индексах и маска их пересечения"""
+    x, y, w, h = (np.asarray(v, dtype=np.int64) for v in (x, y, w, h))
+    n = len(x)
+    empty = np.zeros(0, dtype=np.int64)
+    if n < 2:
+        return empty, empty, empty, np.zeros(0, dtype=bool)
+
+    # Сортируем по левому краю: кандидаты для i - те j > i, чей левый край
+    # лежит левее правого края i
+    order = np.argsort(x, kind="stable")
+    xs, ys, ws, hs = x[order], y[order], w[order], h[order]
+    ends = np.searchsorted(xs, xs + ws, side="left")
+    counts = np.maximum(ends - np.arange(n) - 1, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return order, empty, empty, np.zeros(0, dtype=bool)
+
+    # Разворачиваем кандидатов в плоские массивы пар (i, j)
+    i_idx = np.repeat(np.arange(n), counts)
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    j_idx = i_idx + 1 + (np.arange(total) - starts)
+
+    separated = (
+        (xs[i_idx] + ws[i_idx] <= xs[j_idx])
+        | (xs[j_idx] + ws[j_idx] <= xs[i_idx])
+        | (ys[i_idx] + hs[i_idx] <= ys[j_idx])
+        | (ys[j_idx] + hs[j_idx] <= ys[i_idx])
+    )
+    return order, i_idx, j_idx, ~separated
+
+
+def count_overlaps_sweep(x, y, w, h) -> int:
+    """Количество пересекающихся пар методом sort-and-sweep по интервалам X"""
+    return int(np.count_nonzero(_sweep(x, y, w, h)[3]))
+
+
+def overlapping_pairs(x, y, w, h) -> tuple[np.ndarray, np.ndarray]:
+    """Индексы компонентов каждой пересекающейся пары (sort-and-sweep)"""
+    order, i_idx, j_idx, overlapping = _sweep(x, y, w, h)
+    return order[i_idx[overlapping]], order[j_idx[overlapping]]
+
+
+def count_overlaps(x, y, w, h, engine: str = "brute") -> int:
+    """Количество пересечений выбранным движком коллизий"""
+    if engine == "sweep":
+        return count_overlaps_sweep(x, y, w, h)
+    if engine == "brute":
+        return count_overlaps_brute(x, y, w, h)
+    raise ValueError(
+        f"Неизвестный движок коллизий: {engine}. Допустимо: {COLLISION_ENGINES}"
+    )
+
+
+def collision_engine(config: dict) -> str:
+    """Движок коллизий из ключа "collision" конфига с проверкой значения"""
+    engine = config.get("collision", base_config["collision"])
+    if engine not in COLLISION_ENGINES:
+        raise ValueError(
+            f"Неизвестный движок коллизий: {engine}. Допустимо: {COLLISION_ENGINES}"
+        )
+    return engine
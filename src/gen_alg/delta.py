@@ -0,0 +1,139 @@
+import functools
+
+import numpy as np
+
+from src.gen_alg.collision import count_overlaps
+from src.gen_alg.evaluation import OUT_OF_BOARD_PENALTY, OVERLAP_PENALTY
+from src.gen_alg.problem import ProblemSpec
+
+FULL_RECOMPUTE_SHARE = 0.5  # При изменении большей доли компонентов считаем заново
+
+
+def track_changes(operator):
+    """Обёртка оператора изменчивости: запоминает в особи индексы изменённых компонентов"""
+
+    @functools.wraps(operator)
+    def wrapper(*individuals, **kwargs):
+        before = [np.array(ind, dtype=np.int64) for ind in individuals]
+        result = operator(*individuals, **kwargs)
+        for ind, genome in zip(individuals, before):
+            changed = np.flatnonzero(
+                (np.array(ind, dtype=np.int64) != genome).reshape(-1, 3).any(axis=1)
+            )
+            ind.touched = getattr(ind, "touched", set()) | set(changed.tolist())
+        return result
+
+    return wrapper
+
+
+class DeltaEvaluator:
+    """Инкрементальная оценка: пересчёт слагаемых только для изменённых компонентов"""
+
+    def __init__(self, problem: ProblemSpec, collision: str = "brute"):
+        self.problem = problem
+        self.collision = collision
+
+    def _layout(self, genome: np.ndarray) -> tuple:
+        """Координаты и размеры компонентов с учётом поворота"""
+        placements = genome.reshape(-1, 3)
+        w, h = self.problem.sizes(placements[:, 2])
+        return placements[:, 0], placements[:, 1], w, h
+
+    def _out_of_board(self, x, y, w, h) -> np.ndarray:
+        """Флаги выхода компонентов за границы платы"""
+        return (x + w > self.problem.board_width) | (y + h > self.problem.board_height)
+
+    def _lengths(self, x, y, w, h, indices) -> np.ndarray:
+        """Длины соединений с указанными индексами"""
+        a, b = self.problem.conn_a[indices], self.problem.conn_b[indices]
+        dx = (x[a] + w[a] / 2) - (x[b] + w[b] / 2)
+        dy = (y[a] + h[a] / 2) - (y[b] + h[b] / 2)
+        return (dx**2 + dy**2) ** 0.5
+
+    def _overlaps_with(self, x, y, w, h, indices: np.ndarray) -> int:
+        """Число пересекающихся пар, в которых участвует хотя бы один из компонентов"""
+        xi, yi, wi, hi = (
+            x[indices, None],
+            y[indices, None],
+            w[indices, None],
+            h[indices, None],
+        )
+        overlapping = ~((xi + wi <= x) | (x + w <= xi) | (yi + hi <= y) | (y + h <= yi))
+        overlapping[np.arange(len(indices)), indices] = False  # Сам с собой
+        inside = np.zeros(len(x), dtype=bool)
+        inside[indices] = True
+        # Пары с внешними компонентами считаются один раз, а пары внутри
+        # набора встречаются дважды (i, j) и (j, i)
+        outer = np.count_nonzero(overlapping[:, ~inside])
+        inner = np.count_nonzero(overlapping[:, inside])
+        return int(outer + inner // 2)
+
+    def _fitness(self, terms: dict) -> float:
+        """Итоговое значение функции оценки из частичных слагаемых"""
+        lengths = terms["lengths"]
+        # Последовательная сумма в порядке соединений, как в evaluate
+        total_wirelength = np.cumsum(lengths)[-1] if len(lengths) else 0.0
+        penalty = (
+            terms["overlaps"] * OVERLAP_PENALTY
+            + int(np.count_nonzero(terms["out_of_board"])) * OUT_OF_BOARD_PENALTY
+        )
+        return total_wirelength + penalty
+
+    def full(self, individual) -> tuple[float,]:
+        """Полный расчёт с сохранением частичных слагаемых в особи"""
+        genome = np.array(individual, dtype=np.int64)
+        x, y, w, h = self._layout(genome)
+        individual.terms = {
+            "genome": genome,
+            "out_of_board": self._out_of_board(x, y, w, h),
+            "overlaps": count_overlaps(x, y, w, h, self.collision),
+            "lengths": self._lengths(x, y, w, h, np.arange(self.problem.n_connections)),
+        }
+        individual.touched = set()
+        return (self._fitness(individual.terms),)
+
+    def update(self, individual) -> tuple[float,]:
+        """Пересчёт слагаемых только для затронутых мутацией компонентов"""
+        terms = individual.terms
+        changed = np.array(sorted(individual.touched), dtype=np.int64)
+        genome = np.array(individual, dtype=np.int64)
+
+        old_layout = self._layout(terms["genome"])
+        new_layout = self._layout(genome)
+
+        out_of_board = terms["out_of_board"].copy()
+        out_of_board[changed] = self._out_of_board(*(v[changed] for v in new_layout))
+
+        overlaps = (
+            terms["overlaps"]
+            - self._overlaps_with(*old_layout, changed)
+            + self._overlaps_with(*new_layout, changed)
+        )
+
+        lengths = terms["lengths"].copy()
+        affected = self.problem.incident_connections(changed)
+        if len(affected):
+            lengths[affected] = self._lengths(*new_layout, affected)
+
+        individual.terms = {
+            "genome": genome,
+            "out_of_board": out_of_board,
+            "overlaps": overlaps,
+            "lengths": lengths,
+        }
+        individual.touched = set()
+        return (self._fitness(individual.terms),)
+
+    def evaluate(self, individual) -> tuple[float,]:
+        """Оценка особи: инкрементально, если есть кэш родителя, иначе полностью"""
+        terms = getattr(individual, "terms", None)
+        touched = getattr(individual, "touched", set())
+        if (
+            terms is None
+            or len(terms["genome"]) != len(individual)
+            or len(touched) > FULL_RECOMPUTE_SHARE * self.problem.n_components
+        ):
+            return self.full(individual)
+        if not touched:
+            return (self._fitness(terms),)
+        return self.update(individual)
@@ -0,0 +1,23 @@
+from src.gen_alg.annealing import SimulatedAnnealing
+from src.gen_alg.array_engine import ArrayGeneticAlgorithm
+from src.gen_alg.genetic_algorithm_new import GeneticAlgorithm
+from src.gen_alg.islands import IslandModel
+from src.gen_alg.multilevel import MultilevelPlacement
+from src.utils.base_config import base_config
+
+# Оптимизаторы без интерфейса: один конфиг, run() -> (популяция, fitness_list)
+ENGINES = {
+    "ga": GeneticAlgorithm,
+    "array": ArrayGeneticAlgorithm,
+    "islands": IslandModel,
+    "annealing": SimulatedAnnealing,
+    "multilevel": MultilevelPlacement,
+}
+
+
+def create_engine(config: dict, engine: str | None = None):
+    """Оптимизатор по имени; по умолчанию - из ключа "engine" конфига"""
+    name = engine or config.get("engine", base_config["engine"])
+    if name not in ENGINES:
+        raise ValueError(f"Неизвестный движок: {name}. Допустимо: {tuple(ENGINES)}")
+    return ENGINES[name](config)
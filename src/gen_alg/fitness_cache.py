@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FitnessCache:
+    """LRU-кэш значений функции оценки по содержимому генома и хэшу задачи"""
+
+    def __init__(self, problem_hash: str, maxsize: int = 100_000):
+        self.problem_hash = problem_hash
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, individual) -> tuple:
+        """Ключ кэша: хэш задачи и байты генома (без коллизий между разными геномами)"""
+        return self.problem_hash, np.asarray(individual, dtype=np.int64).tobytes()
+
+    def get(self, key: tuple):
+        """Значение из кэша с обновлением порядка вытеснения, либо None"""
+        fitness = self.entries.get(key)
+        if fitness is not None:
+            self.entries.move_to_end(key)
+        return fitness
+
+    def put(self, key: tuple, fitness: tuple) -> None:
+        """Сохранение значения с вытеснением давно не использованных записей"""
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def evaluate(self, individuals: list, evaluate_many) -> list:
+        """Оценка списка особей: одинаковые геномы считаются один раз"""
+        keys = [self.key(ind) for ind in individuals]
+        results = {}
+        pending = {}  # Ключ -> первая особь с таким геномом, которую нужно оценить
+        for key, ind in zip(keys, individuals):
+            if key in results or key in pending:
+                self.hits += 1
+                continue
+            fitness = self.get(key)
+            if fitness is not None:
+                results[key] = fitness
+                self.hits += 1
+            else:
+                pending[key] = ind
+                self.misses += 1
+
+        if pending:
+            for key, fitness in zip(
+                pending.keys(), evaluate_many(list(pending.values()))
+            ):
+                results[key] = fitness
+                self.put(key, fitness)
+        return [results[key] for key in keys]
+
+    def reset_stats(self) -> None:
+        """Обнуление счётчиков перед новым запуском (записи сохраняются)"""
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Счётчики попаданий и промахов"""
+        total = self.hits + self.misses
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_rate": self.hits / total if total else 0.0,
+            "cache_size": len(self.entries),
+        }
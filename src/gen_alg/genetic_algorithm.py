@@ -1,10 +1,31 @@
-import random
+import time
 import tkinter as tk
+from contextlib import contextmanager
 from tkinter import scrolledtext, ttk
 
 import numpy as np
 from deap import base, creator, tools
 
+from src.gen_alg.analytical import analytical_genomes
+from src.gen_alg.checkpoint import load_checkpoint, save_checkpoint
+from src.gen_alg.collision import collision_engine, count_overlaps_sweep
+from src.gen_alg.delta import DeltaEvaluator, track_changes
+from src.gen_alg.evaluation import (
+    OUT_OF_BOARD_PENALTY,
+    OVERLAP_PENALTY,
+    evaluate_population,
+)
+from src.gen_alg.fitness_cache import FitnessCache
+from src.gen_alg.jit_kernels import register_jit_backend
+from src.gen_alg.local_search import LocalSearch
+from src.gen_alg.parallel import ParallelEvaluator
+from src.gen_alg.problem import ProblemSpec
+from src.gen_alg.repair import Repairer, mut_bounded_int, mut_rotation_bounded
+from src.gen_alg.rng import cx_two_point, make_rng, mut_uniform_int, sel_tournament
+from src.gen_alg.seeding import pack_layout
+from src.gen_alg.snapshots import SnapshotStore, genome_dtype
+from src.gen_alg.stopping import StoppingCriteria
+from src.presentation.board_canvas import BoardCanvas
 from src.utils.base_config import base_config
 
 
@@ -13,12 +34,25 @@ class GeneticAlgorithm:
         self.config = config  # Используемый конфиг из дериктории
         self.setup_ga()
         self.visualization_window = None
-        self.generations_data = []
+        self.generations_data = SnapshotStore(
+            3 * self.problem.n_components,
+            self.config.get("snapshot_capacity", base_config["snapshot_capacity"]),
+            genome_dtype(self.problem.board_width, self.problem.board_height),
+            self.config.get("snapshot_path", base_config["snapshot_path"]),
+        )  # Лучшие особи шагов визуализации: кольцевой буфер и файл на диске
         self.current_generation_idx = 0
+        self.shown_generations = 0  # Сколько сохранённых поколений уже показано
         self.fitness = []
 
     def setup_ga(self):
         """Инициализация генетического алгоритма"""
+        self.problem = ProblemSpec.from_config(
+            self.config
+        )  # Массивы задачи собираются из конфига один раз за запуск
+        self.collision = collision_engine(self.config)
+        self.rng = make_rng(
+            self.config
+        )  # Генератор запуска: вся случайность ГА берётся из него, а не из модуля random
         if not hasattr(creator, "FitnessMin"):  # Если не задана функция минимизации
             creator.create(
                 "FitnessMin", base.Fitness, weights=(-1.0,)
@@ -40,50 +74,144 @@ class GeneticAlgorithm:
         self.toolbox.register(
             "evaluate", self.evaluate
         )  # Алиас для функции оценки особи
-        self.toolbox.register("mate", tools.cxTwoPoint)  # Алиас для функции скрещивания
         self.toolbox.register(
-            "mutate",
-            tools.mutUniformInt,
-            low=0,
-            up=max(self.config["board_width"], self.config["board_height"]) - 1,
-            indpb=0.1,
-        )  # Алиас для функции мутации
+            "evaluate_population", self.evaluate_population
+        )  # Алиас для пакетной оценки списка особей
+        self.toolbox.register(
+            "mate", cx_two_point, rng=self.rng
+        )  # Алиас для функции скрещивания
+        bounded = (
+            self.config.get("mutation", base_config["mutation"]) == "bounded"
+        )  # Границы генов по размерам компонента либо общая граница платы
+        if bounded:
+            self.toolbox.register(
+                "mutate",
+                mut_bounded_int,
+                problem=self.problem,
+                indpb=0.1,
+                rng=self.rng,
+            )  # Алиас для функции мутации
+        else:
+            self.toolbox.register(
+                "mutate",
+                mut_uniform_int,
+                low=0,
+                up=max(self.problem.board_width, self.problem.board_height) - 1,
+                indpb=0.1,
+                rng=self.rng,
+            )  # Алиас для функции мутации
         # TODO добавить в конфиг возможность выбора функции отбора и размера турнирной сетки
         self.toolbox.register(
-            "select", tools.selTournament, tournsize=3
+            "select", sel_tournament, tournsize=3, rng=self.rng
         )  # Алиас для функции отбора(в данном случае турнирного)
-        self.toolbox.register(
-            "mutate_rotation", self.mutRotation, indpb=base_config["indpb"]
-        )  # Алиас для функции мутации поворота, срабатывает с шансом
+        if bounded:
+            self.toolbox.register(
+                "mutate_rotation",
+                mut_rotation_bounded,
+                problem=self.problem,
+                indpb=base_config["indpb"],
+                rng=self.rng,
+            )  # Поворот с переносом компонента внутрь платы
+        else:
+            self.toolbox.register(
+                "mutate_rotation", self.mutRotation, indpb=base_config["indpb"]
+            )  # Алиас для функции мутации поворота, срабатывает с шансом
+        if self.config.get("backend", base_config["backend"]) == "numba":
+            register_jit_backend(
+                self.toolbox, self.problem, self.rng, self.collision
+            )  # JIT-ядра numba; без numba остаётся реализация на Python
+        self.repairer = None
+        if self.config.get("repair", base_config["repair"]):
+            self.repairer = Repairer(self.problem)
+            self.toolbox.register(
+                "repair", self.repairer.repair
+            )  # Перенос компонентов в допустимые позиции перед оценкой
+        self.delta_evaluator = None
+        if self.config.get("delta_evaluation", base_config["delta_evaluation"]):
+            self.delta_evaluator = DeltaEvaluator(self.problem, self.collision)
+            aliases = ("mate", "mutate", "mutate_rotation")
+            if self.repairer is not None:
+                aliases += ("repair",)
+            for alias in aliases:
+                self.toolbox.register(
+                    alias, track_changes(getattr(self.toolbox, alias))
+                )  # Операторы запоминают, какие компоненты они изменили
+        self.fitness_cache = None
+        if self.config.get("fitness_cache", base_config["fitness_cache"]):
+            self.fitness_cache = FitnessCache(
+                self.problem.content_hash,
+                self.config.get(
+                    "fitness_cache_size", base_config["fitness_cache_size"]
+                ),
+            )  # Одинаковые геномы не оцениваются повторно
+        self.local_search = None
+        if self.config.get("local_search_elites", base_config["local_search_elites"]):
+            self.local_search = LocalSearch(
+                self.problem, self.rng, self.collision
+            )  # Дошлифовка лучших особей каждого поколения
+        self.parallel = None  # Пул процессов, существует только во время run()
+        self.evaluations = 0  # Количество реально выполненных оценок
+        self.run_stats = {}  # Статистика последнего запуска
+        self.cancel = None  # Событие отмены запуска (threading.Event)
+        self.recorder = None  # RunRecorder или LiveFeed: точки каждого поколения
+        self.track_diversity = "diversity" in self.config.get(
+            "live_plot_series", base_config["live_plot_series"]
+        )  # Разнообразие считается, только если его показывают
         # TODO добавить в конфиг параметр indpb - вероятность конкрентой мутации(у нас вероятность поворота)
 
     def individual_generator(self):
         """Генерация случайной особи"""
         genome = []
-        for comp in self.config["components"]:  # Перебираем все компоненты в конфиге
+        for width, height in zip(
+            self.problem.widths.tolist(), self.problem.heights.tolist()
+        ):  # Перебираем все компоненты задачи
+            rot = self.rng.randint(0, 1)  # Повёрнут или нет
+            if rot:  # Границы считаются по размерам с учётом поворота
+                width, height = height, width
             max_x = (
-                self.config["board_width"] - comp["width"]
+                self.problem.board_width - width
             )  # В каком диапазоне может появиться компонент по ширине
             max_y = (
-                self.config["board_height"] - comp["height"]
+                self.problem.board_height - height
             )  # В каком диапазоне может появиться компонент по высоте
             x = (
-                random.randint(0, max_x) if max_x >= 0 else 0
+                self.rng.randint(0, max_x) if max_x >= 0 else 0
             )  # Случайная координата по x
             y = (
-                random.randint(0, max_y) if max_y >= 0 else 0
+                self.rng.randint(0, max_y) if max_y >= 0 else 0
             )  # Случайная координата по y
-            rot = random.randint(0, 1)  # Повёрнут или нет
             genome.extend(
                 [x, y, rot]
             )  # Итоговый геном одной особи состоит из 3-х хромосом
         return creator.Individual(genome)  # Геном особи - размещение всех компонентов
 
+    def init_population(self, size: int) -> list:
+        """Начальная популяция: доли особей от аналитического решения и упаковщика,
+        остальные случайные"""
+        analytical = self.config.get(
+            "analytical_fraction", base_config["analytical_fraction"]
+        )
+        fraction = self.config.get("seeding_fraction", base_config["seeding_fraction"])
+        order = self.config.get("seeding_order", base_config["seeding_order"])
+        population = [
+            creator.Individual(genome)
+            for genome in analytical_genomes(
+                self.problem, self.rng, min(size, round(size * analytical))
+            )
+        ]
+        for _ in range(min(size - len(population), round(size * fraction))):
+            genome = pack_layout(self.problem, self.rng, order)
+            if genome is None:  # Плата слишком плотная для упаковщика
+                break
+            population.append(creator.Individual(genome))
+        population.extend(self.toolbox.population(n=size - len(population)))
+        return population
+
     def mutRotation(self, individual: list, indpb: float):
         """Мутация поворота компонента"""
         for i in range(2, len(individual), 3):
             if (
-                random.random() < indpb
+                self.rng.random() < indpb
             ):  # Поворачиваем компонент, если сработала вераятность
                 individual[i] = 1 - individual[i]
         return (individual,)
@@ -91,65 +219,157 @@ class GeneticAlgorithm:
     def evaluate(self, individual):
         """Функция оценки особи"""
         placements = np.array(individual).reshape(-1, 3)  # Преобразуем в матрицу N x 3
+        xs, ys = placements[:, 0], placements[:, 1]
+        widths, heights = self.problem.sizes(
+            placements[:, 2]
+        )  # Размеры с учётом поворота
         overlaps = 0  # Количество пересечений
         out_of_board = 0  # Выход за границы платы
 
-        for i, (x, y, rot) in enumerate(placements):
-            comp = self.config["components"][i]
-            width = comp["height"] if rot else comp["width"]
-            height = comp["width"] if rot else comp["height"]
+        for x, y, width, height in zip(xs, ys, widths, heights):
             if (
-                x + width > self.config["board_width"]
-                or y + height > self.config["board_height"]
+                x + width > self.problem.board_width
+                or y + height > self.problem.board_height
             ):
                 out_of_board += 1
 
-        for i in range(len(self.config["components"])):
-            for j in range(i + 1, len(self.config["components"])):
-                xi, yi, _ = placements[i]
-                xj, yj, _ = placements[j]
-                wi = (
-                    self.config["components"][i]["height"]
-                    if placements[i][2]
-                    else self.config["components"][i]["width"]
-                )
-                hi = (
-                    self.config["components"][i]["width"]
-                    if placements[i][2]
-                    else self.config["components"][i]["height"]
-                )
-                wj = (
-                    self.config["components"][j]["height"]
-                    if placements[j][2]
-                    else self.config["components"][j]["width"]
-                )
-                hj = (
-                    self.config["components"][j]["width"]
-                    if placements[j][2]
-                    else self.config["components"][j]["height"]
-                )
-
-                if not (
-                    xi + wi <= xj or xj + wj <= xi or yi + hi <= yj or yj + hj <= yi
-                ):
-                    overlaps += 1
-
-        centers = []
-        for i, (x, y, rot) in enumerate(placements):
-            comp = self.config["components"][i]
-            width = comp["height"] if rot else comp["width"]
-            height = comp["width"] if rot else comp["height"]
-            centers.append((x + width / 2, y + height / 2))
+        if self.collision == "sweep":
+            overlaps = count_overlaps_sweep(
+                xs, ys, widths, heights
+            )  # Sort-and-sweep вместо перебора всех пар
+        else:
+            for i in range(self.problem.n_components):
+                for j in range(i + 1, self.problem.n_components):
+                    if not (
+                        xs[i] + widths[i] <= xs[j]
+                        or xs[j] + widths[j] <= xs[i]
+                        or ys[i] + heights[i] <= ys[j]
+                        or ys[j] + heights[j] <= ys[i]
+                    ):
+                        overlaps += 1
+
+        centers_x = xs + widths / 2  # Центры компонентов
+        centers_y = ys + heights / 2
 
         total_wirelength = 0.0
-        for a, b in self.config["connections"]:
-            dx = centers[a][0] - centers[b][0]
-            dy = centers[a][1] - centers[b][1]
+        for a, b in zip(self.problem.conn_a, self.problem.conn_b):
+            dx = centers_x[a] - centers_x[b]
+            dy = centers_y[a] - centers_y[b]
             total_wirelength += (dx**2 + dy**2) ** 0.5
 
-        penalty = overlaps * 1000 + out_of_board * 5000
+        penalty = overlaps * OVERLAP_PENALTY + out_of_board * OUT_OF_BOARD_PENALTY
         return (total_wirelength + penalty,)
 
+    def evaluate_population(self, individuals):
+        """Пакетная оценка списка особей за один вызов"""
+        if not individuals:
+            return []
+        placements = np.array(individuals).reshape(
+            len(individuals), -1, 3
+        )  # Тензор P x N x 3
+        return [
+            (fit,)
+            for fit in evaluate_population(self.problem, placements, self.collision)
+        ]
+
+    def evaluate_all(self, individuals):
+        """Оценка особей с использованием кэша, если он включён"""
+        if self.repairer is not None:  # Восстановление меняет гены до поиска в кэше
+            for ind in individuals:
+                self.toolbox.repair(ind)
+        if self.fitness_cache is not None:
+            return self.fitness_cache.evaluate(individuals, self.evaluate_uncached)
+        return self.evaluate_uncached(individuals)
+
+    def evaluate_uncached(self, individuals):
+        """Оценка особей выбранным способом: инкрементально, пакетно или поштучно"""
+        self.evaluations += len(individuals)
+        if self.delta_evaluator is not None:
+            return [self.delta_evaluator.evaluate(ind) for ind in individuals]
+        if self.parallel is not None:
+            return self.parallel.evaluate_population(individuals)
+        if self.config.get("batch_evaluation", base_config["batch_evaluation"]):
+            return self.toolbox.evaluate_population(individuals)
+        return list(map(self.toolbox.evaluate, individuals))
+
+    def next_generation(self, population):
+        """Одно поколение: селекция, кроссовер, мутация и оценка потомков"""
+        # Селекция и создание потомков
+        offspring = self.toolbox.select(population, len(population))
+        offspring = list(map(self.toolbox.clone, offspring))
+
+        # Кроссовер
+        for child1, child2 in zip(offspring[::2], offspring[1::2]):
+            if self.rng.random() < self.config["cxpb"]:
+                self.toolbox.mate(child1, child2)
+                del child1.fitness.values
+                del child2.fitness.values
+
+        # Мутация
+        for mutant in offspring:
+            if self.rng.random() < self.config["mutpb"]:
+                self.toolbox.mutate(mutant)
+                self.toolbox.mutate_rotation(mutant)
+                del mutant.fitness.values
+
+        # Оценка новых особей
+        invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
+        fitnesses = self.evaluate_all(invalid_ind)
+        for ind, fit in zip(invalid_ind, fitnesses):
+            ind.fitness.values = fit
+
+        # Локальный поиск для лучших потомков
+        if self.local_search is not None:
+            elites = self.config.get(
+                "local_search_elites", base_config["local_search_elites"]
+            )
+            budget = self.config.get(
+                "local_search_budget", base_config["local_search_budget"]
+            )
+            for elite in tools.selBest(offspring, k=elites):
+                self.local_search.refine(elite, budget // elites)
+        return offspring
+
+    def record_generation(self, generation: int, population: list) -> None:
+        """Точка траектории: лучшее, среднее, худшее и (если выбрано) разнообразие"""
+        values = [ind.fitness.values[0] for ind in population]
+        diversity = None
+        if self.track_diversity:  # Среднее по генам стандартное отклонение
+            diversity = float(np.array(population).std(axis=0).mean())
+        self.recorder.record(
+            generation, min(values), sum(values) / len(values), max(values), diversity
+        )
+
+    def pool_map(self, func, iterable) -> list:
+        """map тулбокса при работе пула: toolbox.evaluate уходит исполнителям
+        массивами геномов (сама функция привязана к ГА с пулом и не передаётся
+        в процессы), прочие функции выполняются в текущем процессе"""
+        if func is self.toolbox.evaluate:
+            return self.parallel.evaluate_population(list(iterable))
+        return list(map(func, iterable))
+
+    @contextmanager
+    def parallel_pool(self):
+        """Пул процессов для оценки на время одного запуска"""
+        workers = self.config.get("workers", base_config["workers"])
+        if workers == 1:
+            yield
+            return
+        self.parallel = ParallelEvaluator(
+            self.problem,
+            self.collision,
+            self.config.get("backend", base_config["backend"]),
+            workers,
+            self.config.get("parallel_chunk_size", base_config["parallel_chunk_size"]),
+        )
+        self.toolbox.register("map", self.pool_map)  # Оценка в map - на пуле
+        try:
+            yield
+        finally:  # Пул закрывается и при ошибке или прерывании запуска
+            self.toolbox.register("map", map)
+            self.parallel.close()
+            self.parallel = None
+
     def create_visualization_window(self):
         """Создание окна для визуализации с навигацией"""
         self.visualization_window = tk.Toplevel()
@@ -190,10 +410,10 @@ class GeneticAlgorithm:
         board_frame = ttk.Frame(self.visualization_window)
         board_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        self.board_text = scrolledtext.ScrolledText(
-            board_frame, width=60, height=30, font=("Courier New", 10), wrap=tk.NONE
-        )
-        self.board_text.pack(fill=tk.BOTH, expand=True)
+        self.board_canvas = BoardCanvas(
+            board_frame, self.problem, width=600, height=450
+        )  # Масштаб - колесом мыши, сдвиг - перетаскиванием
+        self.board_canvas.pack(fill=tk.BOTH, expand=True)
 
         # Информация о компонентах
         self.components_info = scrolledtext.ScrolledText(
@@ -231,58 +451,39 @@ class GeneticAlgorithm:
     def display_generation(self, gen_idx):
         """Отобразить указанное поколение"""
         if 0 <= gen_idx < len(self.generations_data):
-            gen_data = self.generations_data[gen_idx]
-            individual, gen, fitness = gen_data
+            individual, gen, fitness = self.generations_data[
+                gen_idx
+            ]  # Из буфера или с диска
 
             self.generation_label.config(text=str(gen))
             self.fitness_label.config(text=f"{fitness:.2f}")
 
-            self.board_text.delete(1.0, tk.END)
             self.components_info.delete(1.0, tk.END)
 
-            # Визуализация платы
+            # Визуализация платы: по прямоугольнику на компонент
             placements = np.array(individual).reshape(-1, 3)
-            cell_width = 3
-            empty_cell = " " * cell_width
-            board = np.full(
-                (self.config["board_height"], self.config["board_width"]),
-                empty_cell,
-                dtype=f"U{cell_width}",
-            )
+            self.board_canvas.show(placements)
 
             components_data = []
             out_of_bounds = []
 
-            for idx, (x, y, rot) in enumerate(placements):
-                comp = self.config["components"][idx]
-                width = comp["height"] if rot else comp["width"]
-                height = comp["width"] if rot else comp["height"]
-
+            widths, heights = self.problem.sizes(placements[:, 2])
+            for idx, ((x, y, rot), width, height) in enumerate(
+                zip(placements.tolist(), widths.tolist(), heights.tolist())
+            ):
                 if (
-                    x + width > self.config["board_width"]
-                    or y + height > self.config["board_height"]
+                    x + width > self.problem.board_width
+                    or y + height > self.problem.board_height
                 ):
                     out_of_bounds.append(
                         f"Компонент {idx+1} ({width}x{height}) выходит за границы! [X={x}-{x+width}, Y={y}-{y+height}]"
                     )
                     continue
 
-                symbol = f"C{idx + 1}" + ("'" if rot else " ")
-                for dy in range(height):
-                    for dx in range(width):
-                        if board[y + dy, x + dx] == empty_cell:
-                            board[y + dy, x + dx] = symbol.ljust(cell_width)
-                        else:
-                            board[y + dy, x + dx] = "XX "
-
                 components_data.append(
                     f"Компонент {idx+1}: X={x}, Y={y}, Поворот={rot}, Размер={width}x{height}"
                 )
 
-            self.board_text.insert(tk.END, "Плата:\n")
-            for row in board:
-                self.board_text.insert(tk.END, "|" + "|".join(row) + "|\n")
-
             self.components_info.insert(tk.END, "Расположение компонентов:\n")
             self.components_info.insert(tk.END, "\n".join(components_data))
 
@@ -290,89 +491,182 @@ class GeneticAlgorithm:
                 self.components_info.insert(tk.END, "\n\nОшибки:\n")
                 self.components_info.insert(tk.END, "\n".join(out_of_bounds))
 
-            self.board_text.see(tk.END)
             self.components_info.see(tk.END)
 
-    def run(self, log=None, visualization_steps=None):
-        """Основной метод запуска генетического алгоритма"""
-        if len(self.config["components"]) == 0:
+    def show_latest_generation(self):
+        """Показать последнее сохранённое поколение, создав окно при первом вызове
+
+        Вызывается только из потока Tk: run() окна не трогает и может работать
+        в фоновом потоке, пока интерфейс периодически вызывает этот метод
+        """
+        saved = len(self.generations_data)
+        if saved == self.shown_generations:
+            return  # Новых поколений нет - не мешаем ручной навигации
+        if self.visualization_window is None:
+            self.create_visualization_window()
+        elif not self.visualization_window.winfo_exists():
+            return  # Окно закрыто пользователем
+        self.shown_generations = saved
+        self.current_generation_idx = saved - 1
+        self.display_generation(self.current_generation_idx)
+        self.update_navigation_buttons()
+
+    def checkpoint_state(
+        self,
+        population: list,
+        generation: int,
+        fitness_list: list,
+        stopping: StoppingCriteria,
+    ) -> dict:
+        """Состояние запуска перед поколением generation для контрольной точки"""
+        return {
+            "problem_hash": self.problem.content_hash,
+            "genomes": np.array(population),
+            "fitness": [ind.fitness.values[0] for ind in population],
+            "generation": generation,
+            "fitness_list": fitness_list,
+            "evaluations": self.evaluations,
+            "elapsed": stopping.elapsed,
+            "best": stopping.best,
+            "last_improvement": stopping.last_improvement,
+            "random_state": self.rng.getstate(),
+        }
+
+    def restore_state(self, state: dict, stopping: StoppingCriteria) -> list:
+        """Восстановление популяции, счётчиков и генератора из контрольной точки"""
+        population = []
+        for genome, fit in zip(state["genomes"].tolist(), state["fitness"].tolist()):
+            ind = creator.Individual(genome)
+            ind.fitness.values = (fit,)
+            population.append(ind)
+        self.evaluations = state["evaluations"]
+        stopping.started -= state["elapsed"]  # Бюджет времени учитывает прошлый запуск
+        stopping.best = state["best"]
+        stopping.last_improvement = state["last_improvement"]
+        self.rng.setstate(state["random_state"])
+        return population
+
+    def run(self, log=None, visualization_steps=None, resume_from=None):
+        """Основной метод запуска генетического алгоритма
+
+        Лучшие особи шагов визуализации копятся в generations_data; log
+        вызывается из того же потока, что и run(). С ключом "checkpoint_path"
+        запуск сохраняется по checkpoint_every/checkpoint_interval и при отмене
+        (в том числе закрытием окна); resume_from - точка для продолжения
+        """
+        if self.problem.n_components == 0:
             raise ValueError(
                 "Нет компонентов для размещения. Добавьте компоненты в конфигурацию."
             )
+        self.evaluations = 0
+        if self.fitness_cache is not None:
+            self.fitness_cache.reset_stats()
+        if self.repairer is not None:
+            self.repairer.reset_stats()
+        if self.local_search is not None:
+            self.local_search.reset_stats()
 
         vis_steps = (
             visualization_steps
             if visualization_steps is not None
             else self.config.get("visualization_steps", [])
         )
-        self.generations_data = []
-
-        population = self.toolbox.population(n=self.config["population_size"])
-
-        # Инициализация fitness
-        for ind in population:
-            ind.fitness.values = self.toolbox.evaluate(ind)
-
-        # Создаем окно визуализации
-        self.create_visualization_window()
-
-        # Сохраняем начальную популяцию
-        best_ind = tools.selBest(population, k=1)[0]
-        self.generations_data.append((best_ind, 0, best_ind.fitness.values[0]))
-        self.display_generation(0)
-        self.update_navigation_buttons()
+        self.generations_data.clear()
+        self.shown_generations = 0
+        self.fitness = []
 
-        if log:
-            log("Начальная популяция:")
-            log("Поколение: 0")
-            log(f"Оценочная функция: {best_ind.fitness.values[0]}")
-
-        self.fitness.append(best_ind.fitness.values[0])
-
-        # Основной цикл генетического алгоритма
-        for gen in range(1, self.config["generations"] + 1):
-            # Селекция и создание потомков
-            offspring = self.toolbox.select(population, len(population))
-            offspring = list(map(self.toolbox.clone, offspring))
-
-            # Кроссовер
-            for child1, child2 in zip(offspring[::2], offspring[1::2]):
-                if random.random() < self.config["cxpb"]:
-                    self.toolbox.mate(child1, child2)
-                    del child1.fitness.values
-                    del child2.fitness.values
-
-            # Мутация
-            for mutant in offspring:
-                if random.random() < self.config["mutpb"]:
-                    self.toolbox.mutate(mutant)
-                    self.toolbox.mutate_rotation(mutant)
-                    del mutant.fitness.values
-
-            # Оценка новых особей
-            invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-            fitnesses = map(self.toolbox.evaluate, invalid_ind)
-            for ind, fit in zip(invalid_ind, fitnesses):
-                ind.fitness.values = fit
-
-            population[:] = offspring
-
-            # Сохраняем поколения для визуализации
-            if gen in vis_steps or gen == self.config["generations"]:
+        checkpoint_path = self.config.get(
+            "checkpoint_path", base_config["checkpoint_path"]
+        )
+        checkpoint_every = self.config.get(
+            "checkpoint_every", base_config["checkpoint_every"]
+        )
+        checkpoint_interval = self.config.get(
+            "checkpoint_interval", base_config["checkpoint_interval"]
+        )
+        first_generation = 1
+
+        stopping = StoppingCriteria(self.config, self.cancel)
+        with self.parallel_pool():  # Пул процессов, если задано workers > 1
+            if resume_from is not None:
+                state = load_checkpoint(resume_from, self.problem.content_hash)
+                population = self.restore_state(state, stopping)
+                self.fitness = state["fitness_list"]
+                first_generation = state["generation"]
                 best_ind = tools.selBest(population, k=1)[0]
                 self.generations_data.append(
-                    (best_ind, gen, best_ind.fitness.values[0])
+                    best_ind, first_generation - 1, best_ind.fitness.values[0]
                 )
+                if log:
+                    log(f"Продолжение с поколения {first_generation}")
+                    log(f"Оценочная функция: {best_ind.fitness.values[0]}")
+            else:
+                population = self.init_population(self.config["population_size"])
 
-                self.fitness.append(best_ind.fitness.values[0])
+                # Инициализация fitness
+                for ind, fit in zip(population, self.evaluate_all(population)):
+                    ind.fitness.values = fit
 
-                # Автоматически показываем последнее сохраненное поколение
-                self.current_generation_idx = len(self.generations_data) - 1
-                self.display_generation(self.current_generation_idx)
-                self.update_navigation_buttons()
+                # Сохраняем начальную популяцию
+                best_ind = tools.selBest(population, k=1)[0]
+                self.generations_data.append(best_ind, 0, best_ind.fitness.values[0])
 
                 if log:
-                    log(f"\nПоколение {gen}:")
+                    log("Начальная популяция:")
+                    log("Поколение: 0")
                     log(f"Оценочная функция: {best_ind.fitness.values[0]}")
 
+                self.fitness.append(best_ind.fitness.values[0])
+
+            # Основной цикл генетического алгоритма
+            last_checkpoint = time.perf_counter()
+            for gen in range(first_generation, self.config["generations"] + 1):
+                population[:] = self.next_generation(population)
+                best_ind = tools.selBest(population, k=1)[0]
+                if self.recorder is not None:
+                    self.record_generation(gen, population)
+                stop_reason = stopping.check(gen, best_ind.fitness.values[0])
+
+                # Сохраняем поколения для визуализации
+                if gen in vis_steps or stop_reason:
+                    self.generations_data.append(
+                        best_ind, gen, best_ind.fitness.values[0]
+                    )
+
+                    self.fitness.append(best_ind.fitness.values[0])
+
+                    if log:
+                        log(f"\nПоколение {gen}:")
+                        log(f"Оценочная функция: {best_ind.fitness.values[0]}")
+
+                # Контрольная точка каждые N поколений, T секунд или при отмене
+                if checkpoint_path and (
+                    stop_reason == "cancelled"
+                    or (checkpoint_every and gen % checkpoint_every == 0)
+                    or (
+                        checkpoint_interval
+                        and time.perf_counter() - last_checkpoint >= checkpoint_interval
+                    )
+                ):
+                    save_checkpoint(
+                        checkpoint_path,
+                        self.checkpoint_state(
+                            population, gen + 1, self.fitness, stopping
+                        ),
+                    )
+                    last_checkpoint = time.perf_counter()
+
+                if stop_reason:  # Досрочная остановка или последнее поколение
+                    if log and stop_reason != "generations":
+                        log(f"\nОстановка по критерию: {stop_reason}")
+                    break
+
+        self.run_stats = {"evaluations": self.evaluations, **stopping.stats()}
+        if self.fitness_cache is not None:
+            self.run_stats.update(self.fitness_cache.stats())
+        if self.repairer is not None:
+            self.run_stats.update(self.repairer.stats())
+        if self.local_search is not None:
+            self.run_stats.update(self.local_search.stats())
+
         return population, self.fitness
@@ -0,0 +1,211 @@
+import itertools
+import multiprocessing
+import queue
+import time
+
+from deap import creator, tools
+
+from src.gen_alg.genetic_algorithm_new import GeneticAlgorithm
+from src.gen_alg.rng import spawn_seeds
+from src.gen_alg.stopping import StoppingCriteria
+from src.utils.base_config import base_config
+
+TOPOLOGIES = ("ring", "torus")  # Допустимые значения ключа "topology"
+POLL_INTERVAL = 0.1  # Период проверки флага остановки при ожидании, с
+SHARED_REASONS = ("target_fitness", "stagnation")  # Останавливают все острова
+
+
+def torus_shape(islands: int) -> tuple[int, int]:
+    """Размер решётки тора: строки x столбцы, как можно ближе к квадрату"""
+    rows = max(r for r in range(1, int(islands**0.5) + 1) if islands % r == 0)
+    return rows, islands // rows
+
+
+def neighbors(island: int, islands: int, topology: str = "ring") -> list[int]:
+    """Острова, которым данный остров отправляет мигрантов"""
+    if islands < 2:
+        return []
+    if topology == "ring":
+        return [(island + 1) % islands]
+    if topology == "torus":
+        rows, cols = torus_shape(islands)
+        row, col = divmod(island, cols)
+        targets = {
+            row * cols + (col + 1) % cols,
+            row * cols + (col - 1) % cols,
+            ((row + 1) % rows) * cols + col,
+            ((row - 1) % rows) * cols + col,
+        }
+        targets.discard(island)
+        return sorted(targets)
+    raise ValueError(f"Неизвестная топология: {topology}. Допустимо: {TOPOLOGIES}")
+
+
+def _island_worker(config: dict, island: int, inboxes: list, results, stop) -> None:
+    """Эволюция одного острова с периодическим обменом лучшими особями
+
+    stop - общий флаг (multiprocessing.Event): его поднимает остров, достигший
+    цели или стагнации, и основной процесс по отмене или бюджету времени; остров
+    проверяет его каждое поколение и во время ожидания мигрантов
+    """
+    islands = len(inboxes)
+    topology = config.get("topology", base_config["topology"])
+    interval = config.get("migration_interval", base_config["migration_interval"])
+    migrants = config.get("migrants", base_config["migrants"])
+    vis_steps = config.get("visualization_steps", [])
+    targets = neighbors(island, islands, topology)
+    sources = sum(island in neighbors(j, islands, topology) for j in range(islands))
+
+    seed = spawn_seeds(config.get("seed", base_config["seed"]), islands)[island]
+    ga = GeneticAlgorithm(
+        dict(config, seed=seed, workers=1)
+    )  # Свой поток случайных чисел на остров, без вложенных пулов процессов
+    stopping = StoppingCriteria(
+        dict(config, time_budget=None)
+    )  # Бюджет времени общий, его отслеживает основной процесс
+    population = ga.init_population(config["population_size"])
+    for ind, fit in zip(population, ga.evaluate_all(population)):
+        ind.fitness.values = fit
+
+    fitness_list = []
+    pending = {}  # Эпоха -> полученные пакеты мигрантов (соседи могут обогнать)
+    for generation in range(0, config["generations"] + 1):
+        population[:] = ga.next_generation(population)
+        best_fitness = tools.selBest(population, k=1)[0].fitness.values[0]
+
+        if generation in vis_steps:
+            fitness_list.append(best_fitness)
+
+        if stopping.check(generation, best_fitness) in SHARED_REASONS:
+            stop.set()
+        if stopping.reason or stop.is_set():
+            break
+
+        epoch, phase = divmod(generation + 1, interval)
+        if phase or not targets:
+            continue
+
+        # Отправляем лучших соседям и ждём мигрантов этой же эпохи
+        best = tools.selBest(population, k=migrants)
+        payload = [(list(ind), ind.fitness.values) for ind in best]
+        for target in targets:
+            inboxes[target].put((epoch, payload))
+        while len(pending.get(epoch, [])) < sources and not stop.is_set():
+            try:
+                sender_epoch, received = inboxes[island].get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            pending.setdefault(sender_epoch, []).append(received)
+        if len(pending.get(epoch, [])) < sources:  # Остановка во время ожидания
+            break
+        incoming = sorted(
+            (item for received in pending.pop(epoch) for item in received),
+            key=lambda item: (item[1], item[0]),
+        )[: len(population)]
+
+        # Мигранты заменяют худших особей острова
+        population.sort(key=lambda ind: ind.fitness.values)
+        for slot, (genome, fit) in zip(
+            range(len(population) - len(incoming), len(population)), incoming
+        ):
+            migrant = creator.Individual(genome)
+            migrant.fitness.values = fit
+            population[slot] = migrant
+
+    results.put(
+        (
+            island,
+            [list(ind) for ind in population],
+            [ind.fitness.values for ind in population],
+            fitness_list,
+            ga.evaluations,
+            stopping.reason,
+            stopping.generations,
+        )
+    )
+
+
+class IslandModel:
+    """Островная модель: K популяций в отдельных процессах с миграцией лучших особей"""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.ga = GeneticAlgorithm(config)  # Создаёт классы DEAP в основном процессе
+        self.run_stats = {}
+        self.cancel = None  # Событие отмены запуска (threading.Event)
+
+    def run(self) -> tuple[list, list]:
+        if self.ga.problem.n_components == 0:
+            raise ValueError(
+                "Нет компонентов для размещения. Добавьте компоненты в конфигурацию."
+            )
+        islands = self.config.get("islands", base_config["islands"])
+        time_budget = self.config.get("time_budget", base_config["time_budget"])
+        started = time.perf_counter()
+        context = multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(islands)]
+        results = context.Queue()
+        stop = context.Event()  # Общий флаг остановки всех островов
+        processes = [
+            context.Process(
+                target=_island_worker,
+                args=(self.config, island, inboxes, results, stop),
+                daemon=True,
+            )
+            for island in range(islands)
+        ]
+
+        collected = {}
+        reason = None  # Остановка по отмене или бюджету времени
+        try:
+            for process in processes:
+                process.start()
+            while len(collected) < islands:
+                if reason is None:
+                    if self.cancel is not None and self.cancel.is_set():
+                        reason = "cancelled"
+                    elif (
+                        time_budget is not None
+                        and time.perf_counter() - started >= time_budget
+                    ):
+                        reason = "time_budget"
+                    if reason is not None:  # Флаг пересылается в процессы островов
+                        stop.set()
+                try:
+                    island, *result = results.get(timeout=POLL_INTERVAL)
+                    collected[island] = result
+                except queue.Empty:
+                    if any(p.exitcode not in (None, 0) for p in processes):
+                        raise RuntimeError("Процесс острова завершился с ошибкой")
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        # Объединяем популяции островов и берём лучшее значение по шагам среди
+        # островов, ещё работавших на этом шаге (остановившиеся раньше - None)
+        population = []
+        for island in range(islands):
+            genomes, fitnesses = collected[island][:2]
+            for genome, fit in zip(genomes, fitnesses):
+                ind = creator.Individual(genome)
+                ind.fitness.values = fit
+                population.append(ind)
+        fitness_list = [
+            min(value for value in values if value is not None)
+            for values in itertools.zip_longest(
+                *(collected[island][2] for island in range(islands))
+            )
+        ]
+
+        reasons = [collected[island][4] for island in range(islands)]
+        self.run_stats = {
+            "islands": islands,
+            "evaluations": sum(collected[island][3] for island in range(islands)),
+            "stop_reason": reason
+            or next((r for r in SHARED_REASONS if r in reasons), "generations"),
+            "generations": max(collected[island][5] for island in range(islands)),
+            "elapsed": time.perf_counter() - started,
+        }
+        return population, fitness_list
@@ -0,0 +1,258 @@
+import random
+
+import numpy as np
+
+from src.gen_alg.evaluation import OUT_OF_BOARD_PENALTY, OVERLAP_PENALTY
+from src.gen_alg.problem import ProblemSpec
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # Без numba работает обычная реализация на Python/DEAP
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Заглушка декоратора: функции остаются обычными Python-функциями"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def count_overlaps_sweep_kernel(xs, ys, w, h):
+    """Sort-and-sweep по интервалам X: проверяются только пары, пересекающиеся по X"""
+    order = np.argsort(xs, kind="mergesort")
+    n = order.shape[0]
+    overlaps = 0
+    for k in range(n):
+        i = order[k]
+        right = xs[i] + w[i]
+        for m in range(k + 1, n):
+            j = order[m]
+            if xs[j] >= right:
+                break
+            if not (
+                xs[j] + w[j] <= xs[i] or ys[i] + h[i] <= ys[j] or ys[j] + h[j] <= ys[i]
+            ):
+                overlaps += 1
+    return overlaps
+
+
+@njit(cache=True)
+def evaluate_kernel(
+    genome,
+    widths,
+    heights,
+    conn_a,
+    conn_b,
+    board_w,
+    board_h,
+    sweep,
+    overlap_penalty,
+    out_of_board_penalty,
+):
+    """Оценка одной особи по плоскому геному [x0, y0, r0, x1, y1, r1, ...]
+
+    Штрафы передаются аргументами (OVERLAP_PENALTY, OUT_OF_BOARD_PENALTY):
+    константа внутри ядра с cache=True не обновилась бы при их изменении
+    """
+    n = widths.shape[0]
+    w = np.empty(n, dtype=np.int64)
+    h = np.empty(n, dtype=np.int64)
+    out_of_board = 0
+    for i in range(n):
+        if genome[3 * i + 2] != 0:
+            w[i] = heights[i]
+            h[i] = widths[i]
+        else:
+            w[i] = widths[i]
+            h[i] = heights[i]
+        if genome[3 * i] + w[i] > board_w or genome[3 * i + 1] + h[i] > board_h:
+            out_of_board += 1
+
+    if sweep:
+        overlaps = count_overlaps_sweep_kernel(genome[0::3], genome[1::3], w, h)
+    else:
+        overlaps = 0
+        for i in range(n):
+            xi = genome[3 * i]
+            yi = genome[3 * i + 1]
+            for j in range(i + 1, n):
+                xj = genome[3 * j]
+                yj = genome[3 * j + 1]
+                if not (
+                    xi + w[i] <= xj
+                    or xj + w[j] <= xi
+                    or yi + h[i] <= yj
+                    or yj + h[j] <= yi
+                ):
+                    overlaps += 1
+
+    total_wirelength = 0.0
+    for k in range(conn_a.shape[0]):
+        a = conn_a[k]
+        b = conn_b[k]
+        dx = (genome[3 * a] + w[a] / 2) - (genome[3 * b] + w[b] / 2)
+        dy = (genome[3 * a + 1] + h[a] / 2) - (genome[3 * b + 1] + h[b] / 2)
+        total_wirelength += (dx**2 + dy**2) ** 0.5
+
+    return total_wirelength + (
+        overlaps * overlap_penalty + out_of_board * out_of_board_penalty
+    )
+
+
+@njit(cache=True)
+def evaluate_batch_kernel(
+    genomes,
+    widths,
+    heights,
+    conn_a,
+    conn_b,
+    board_w,
+    board_h,
+    sweep,
+    overlap_penalty,
+    out_of_board_penalty,
+):
+    """Оценка популяции: матрица (P x 3N) -> P значений функции оценки"""
+    result = np.empty(genomes.shape[0])
+    for p in range(genomes.shape[0]):
+        result[p] = evaluate_kernel(
+            genomes[p],
+            widths,
+            heights,
+            conn_a,
+            conn_b,
+            board_w,
+            board_h,
+            sweep,
+            overlap_penalty,
+            out_of_board_penalty,
+        )
+    return result
+
+
+@njit(cache=True)
+def mutate_uniform_int_kernel(genome, low, up, indpb, seed):
+    """Аналог tools.mutUniformInt: каждый ген с шансом indpb заменяется на [low, up]
+
+    Генератор numba общий для процесса, поэтому каждый вызов засевается
+    числом seed из генератора запуска
+    """
+    np.random.seed(seed)
+    for i in range(genome.shape[0]):
+        if np.random.random() < indpb:
+            genome[i] = np.random.randint(low, up + 1)
+
+
+@njit(cache=True)
+def mutate_rotation_kernel(genome, indpb, seed):
+    """Аналог GeneticAlgorithm.mutRotation над плоским геномом"""
+    np.random.seed(seed)
+    for i in range(2, genome.shape[0], 3):
+        if np.random.random() < indpb:
+            genome[i] = 1 - genome[i]
+
+
+@njit(cache=True)
+def cx_two_point_kernel(genome1, genome2, seed):
+    """Аналог tools.cxTwoPoint: обмен участком между двумя точками разреза"""
+    np.random.seed(seed)
+    size = min(genome1.shape[0], genome2.shape[0])
+    if size < 2:
+        return
+    cxpoint1 = np.random.randint(1, size + 1)
+    cxpoint2 = np.random.randint(1, size)
+    if cxpoint2 >= cxpoint1:
+        cxpoint2 += 1
+    else:
+        cxpoint1, cxpoint2 = cxpoint2, cxpoint1
+    for i in range(cxpoint1, cxpoint2):
+        genome1[i], genome2[i] = genome2[i], genome1[i]
+
+
+def register_jit_backend(
+    toolbox, problem: ProblemSpec, rng: random.Random, collision: str = "brute"
+) -> bool:
+    """Подменяет оценку и операторы тулбокса на JIT-версии, если numba доступна;
+    случайность ядер берётся из генератора запуска rng (зерно на каждый вызов)"""
+    if not NUMBA_AVAILABLE:
+        return False
+
+    widths, heights = problem.widths, problem.heights
+    conn_a, conn_b = problem.conn_a, problem.conn_b
+    board_w, board_h = problem.board_width, problem.board_height
+    sweep = collision == "sweep"
+    mutate_params = toolbox.mutate.keywords  # low/up/indpb из исходной регистрации
+    rotation_indpb = toolbox.mutate_rotation.keywords["indpb"]
+    uniform = "up" in mutate_params  # Ограниченная мутация остаётся на Python
+
+    def evaluate(individual):
+        genome = np.asarray(individual, dtype=np.int64)
+        return (
+            evaluate_kernel(
+                genome,
+                widths,
+                heights,
+                conn_a,
+                conn_b,
+                board_w,
+                board_h,
+                sweep,
+                OVERLAP_PENALTY,
+                OUT_OF_BOARD_PENALTY,
+            ),
+        )
+
+    def evaluate_population(individuals):
+        if not individuals:
+            return []
+        genomes = np.array(individuals, dtype=np.int64)
+        fitnesses = evaluate_batch_kernel(
+            genomes,
+            widths,
+            heights,
+            conn_a,
+            conn_b,
+            board_w,
+            board_h,
+            sweep,
+            OVERLAP_PENALTY,
+            OUT_OF_BOARD_PENALTY,
+        )
+        return [(fit,) for fit in fitnesses]
+
+    def mate(ind1, ind2):
+        genome1 = np.asarray(ind1, dtype=np.int64)
+        genome2 = np.asarray(ind2, dtype=np.int64)
+        cx_two_point_kernel(genome1, genome2, rng.getrandbits(32))
+        ind1[:] = genome1.tolist()
+        ind2[:] = genome2.tolist()
+        return ind1, ind2
+
+    def mutate(individual):
+        genome = np.asarray(individual, dtype=np.int64)
+        mutate_uniform_int_kernel(
+            genome,
+            mutate_params["low"],
+            mutate_params["up"],
+            mutate_params["indpb"],
+            rng.getrandbits(32),
+        )
+        individual[:] = genome.tolist()
+        return (individual,)
+
+    def mutate_rotation(individual):
+        genome = np.asarray(individual, dtype=np.int64)
+        mutate_rotation_kernel(genome, rotation_indpb, rng.getrandbits(32))
+        individual[:] = genome.tolist()
+        return (individual,)
+
+    toolbox.register("evaluate", evaluate)
+    toolbox.register("evaluate_population", evaluate_population)
+    toolbox.register("mate", mate)
+    if uniform:
+        toolbox.register("mutate", mutate)
+        toolbox.register("mutate_rotation", mutate_rotation)
+    return True
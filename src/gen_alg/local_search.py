@@ -0,0 +1,97 @@
+import random
+
+import numpy as np
+
+from src.gen_alg.delta import DeltaEvaluator
+from src.gen_alg.problem import ProblemSpec
+from src.gen_alg.repair import position_bounds
+
+MAX_SHIFT = 2  # Наибольший сдвиг компонента за один ход по каждой оси
+
+
+class LocalSearch:
+    """Локальный поиск (восхождение) для лучших особей поколения
+
+    Ходы - сдвиг компонента, поворот и обмен позициями двух компонентов;
+    каждый ход оценивается инкрементально через DeltaEvaluator
+    """
+
+    def __init__(
+        self, problem: ProblemSpec, rng: random.Random, collision: str = "brute"
+    ):
+        self.problem = problem
+        self.rng = rng
+        self.delta = DeltaEvaluator(problem, collision)
+        self.max_x, self.max_y = position_bounds(problem)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.moves = 0  # Оценённых ходов
+        self.accepted = 0  # Принятых (улучшающих) ходов
+
+    def _clamp(self, individual, c: int) -> None:
+        """Координаты компонента c в пределах платы для его поворота"""
+        rotated = int(individual[3 * c + 2] != 0)
+        individual[3 * c] = min(max(individual[3 * c], 0), self.max_x[rotated][c])
+        individual[3 * c + 1] = min(
+            max(individual[3 * c + 1], 0), self.max_y[rotated][c]
+        )
+
+    def _move(self, individual) -> list[int]:
+        """Случайный ход на месте; возвращает изменённые компоненты"""
+        n = self.problem.n_components
+        c = self.rng.randrange(n)
+        kind = self.rng.random()
+        if kind < 0.6 or n == 1:  # Сдвиг
+            individual[3 * c] += self.rng.randint(-MAX_SHIFT, MAX_SHIFT)
+            individual[3 * c + 1] += self.rng.randint(-MAX_SHIFT, MAX_SHIFT)
+            self._clamp(individual, c)
+            return [c]
+        if kind < 0.8:  # Поворот
+            individual[3 * c + 2] = 1 - int(individual[3 * c + 2] != 0)
+            self._clamp(individual, c)
+            return [c]
+        other = self.rng.randrange(n - 1)  # Обмен позициями с другим компонентом
+        other += other >= c
+        for offset in (0, 1):
+            individual[3 * c + offset], individual[3 * other + offset] = (
+                individual[3 * other + offset],
+                individual[3 * c + offset],
+            )
+        self._clamp(individual, c)
+        self._clamp(individual, other)
+        return [c, other]
+
+    def refine(self, individual, budget: int) -> None:
+        """Восхождение на budget ходов; особь и её оценка меняются на месте"""
+        terms = getattr(individual, "terms", None)
+        if (
+            terms is None
+            or not individual.fitness.valid
+            or not np.array_equal(terms["genome"], individual)
+        ):
+            (fitness,) = self.delta.full(individual)
+        else:
+            fitness = individual.fitness.values[0]
+
+        for _ in range(budget):
+            before = list(individual)
+            old_terms = individual.terms
+            individual.touched = set(self._move(individual))
+            (candidate,) = self.delta.update(individual)
+            self.moves += 1
+            if candidate < fitness:
+                fitness = candidate
+                self.accepted += 1
+            else:  # Откат хода вместе с частичными слагаемыми
+                individual[:] = before
+                individual.terms = old_terms
+                individual.touched = set()
+        individual.fitness.values = (fitness,)
+
+    def stats(self) -> dict:
+        """Статистика локального поиска для run_stats"""
+        return {
+            "local_search_moves": self.moves,
+            "local_search_accepted": self.accepted,
+        }
@@ -0,0 +1,189 @@
+import random
+import time
+
+import numpy as np
+from deap import creator
+
+from src.gen_alg.annealing import SimulatedAnnealing
+from src.gen_alg.collision import collision_engine
+from src.gen_alg.evaluation import evaluate_population
+from src.gen_alg.genetic_algorithm_new import GeneticAlgorithm
+from src.gen_alg.problem import ProblemSpec
+from src.gen_alg.repair import Repairer
+from src.gen_alg.rng import make_rng
+from src.utils.base_config import base_config
+
+MIN_REDUCTION = 0.9  # Огрубление прекращается, если уровень сократился < 10%
+MAX_COARSE_DENSITY = 0.8  # Предельная доля платы под прямоугольниками кластеров
+
+
+def coarsen(config: dict, rng: random.Random) -> tuple[dict, np.ndarray, np.ndarray]:
+    """Один уровень огрубления: паросочетание по самым тяжёлым связям
+
+    Возвращает грубый конфиг, индекс кластера для каждого компонента и
+    смещения компонентов (dx, dy) внутри прямоугольника кластера
+    """
+    components = config["components"]
+    n = len(components)
+    weights = {}  # (i, j) -> число связей между компонентами
+    for a, b in config["connections"]:
+        if a != b:
+            key = (min(a, b), max(a, b))
+            weights[key] = weights.get(key, 0) + 1
+    neighbors = [[] for _ in range(n)]
+    for (a, b), weight in weights.items():
+        neighbors[a].append((weight, b))
+        neighbors[b].append((weight, a))
+
+    cluster = np.full(n, -1, dtype=np.int64)
+    offsets = np.zeros((n, 2), dtype=np.int64)
+    clusters = []  # Размеры кластеров грубого уровня
+    order = list(range(n))
+    rng.shuffle(order)
+    for c in order:
+        if cluster[c] >= 0:
+            continue
+        w1, h1 = components[c]["width"], components[c]["height"]
+        free = [(weight, other) for weight, other in neighbors[c] if cluster[other] < 0]
+        cluster[c] = len(clusters)
+        if not free:
+            clusters.append({"width": w1, "height": h1})
+            continue
+        # Самая тяжёлая связь; при равенстве - партнёр, с которым меньше
+        # пустого места в общем прямоугольнике
+        merges = []
+        for weight, other in free:
+            w2, h2 = components[other]["width"], components[other]["height"]
+            beside = (w1 + w2, max(h1, h2), (w1, 0))
+            above = (max(w1, w2), h1 + h2, (0, h1))
+            width, height, offset = min(
+                beside, above, key=lambda shape: (shape[0] * shape[1], max(shape[:2]))
+            )
+            waste = width * height - w1 * h1 - w2 * h2
+            merges.append((weight, -waste, other, width, height, offset))
+        _, _, other, width, height, offset = max(merges, key=lambda m: m[:2])
+        cluster[other] = cluster[c]
+        offsets[other] = offset
+        clusters.append({"width": width, "height": height})
+
+    connections = [
+        [int(cluster[a]), int(cluster[b])]
+        for a, b in config["connections"]
+        if cluster[a] != cluster[b]
+    ]  # Связи внутри кластера исчезают, кратные сохраняются как вес
+    return dict(config, components=clusters, connections=connections), cluster, offsets
+
+
+def uncoarsen(
+    placements: np.ndarray, cluster: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """Раскладка уровня ниже: компонент = позиция кластера + смещение;
+    поворот кластера транспонирует смещения и поворачивает компоненты"""
+    parent = placements[cluster]
+    rotated = parent[:, 2] != 0
+    dx = np.where(rotated, offsets[:, 1], offsets[:, 0])
+    dy = np.where(rotated, offsets[:, 0], offsets[:, 1])
+    return np.stack(
+        [parent[:, 0] + dx, parent[:, 1] + dy, rotated.astype(np.int64)], axis=1
+    )
+
+
+class MultilevelPlacement:
+    """Многоуровневое размещение: огрубление графа связей, ГА на грубой задаче
+    и уточнение локальным поиском при возврате на каждый уровень"""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.problem = ProblemSpec.from_config(config)
+        self.collision = collision_engine(config)
+        self.rng = make_rng(config)
+        self.threshold = config.get(
+            "multilevel_threshold", base_config["multilevel_threshold"]
+        )
+        self.refine_moves = config.get(
+            "multilevel_refine_moves", base_config["multilevel_refine_moves"]
+        )
+        self.evaluations = 0
+        self.run_stats = {}
+        self.cancel = None  # Событие отмены запуска (threading.Event)
+
+    def hierarchy(self) -> tuple[list, dict]:
+        """Уровни огрубления от исходной задачи к самой грубой"""
+        levels = []
+        config = self.config
+        board_area = self.problem.board_width * self.problem.board_height
+        while len(config["components"]) > self.threshold:
+            coarse, cluster, offsets = coarsen(config, self.rng)
+            if len(coarse["components"]) > MIN_REDUCTION * len(config["components"]):
+                break  # Связей не хватает для дальнейшего огрубления
+            area = sum(c["width"] * c["height"] for c in coarse["components"])
+            if area > MAX_COARSE_DENSITY * board_area:
+                break  # Пустоты внутри кластеров не дадут разместить их без пересечений
+            levels.append((config, cluster, offsets))
+            config = coarse
+        return levels, config
+
+    def run(self) -> tuple[list, list]:
+        if self.problem.n_components == 0:
+            raise ValueError(
+                "Нет компонентов для размещения. Добавьте компоненты в конфигурацию."
+            )
+        started = time.perf_counter()
+        levels, coarsest = self.hierarchy()
+
+        # Бюджет времени делится поровну между ГА и уточнением уровней
+        budget = self.config.get("time_budget", base_config["time_budget"])
+        stage = {} if budget is None else {"time_budget": budget / (len(levels) + 1)}
+        if self.refine_moves:
+            stage["anneal_moves"] = self.refine_moves
+        stage["checkpoint_path"] = None  # Точки грубых уровней не подходят к задаче
+
+        # ГА на самой грубой задаче
+        ga = GeneticAlgorithm(dict(coarsest, **stage))
+        ga.cancel = self.cancel
+        population, _ = ga.run()
+        best = min(population, key=lambda ind: ind.fitness.values[0])
+        placements = np.array(best, dtype=np.int64).reshape(-1, 3)
+        self.evaluations = ga.evaluations
+        fitness_list = [best.fitness.values[0]]
+        reasons = [ga.run_stats["stop_reason"]]  # Причины остановки этапов
+
+        # Возврат по уровням с уточнением отжигом от спроецированной раскладки
+        for config, cluster, offsets in reversed(levels):
+            placements = uncoarsen(placements, cluster, offsets)
+            problem = ProblemSpec.from_config(config)
+            individual = creator.Individual(placements.reshape(-1).tolist())
+            Repairer(problem).repair(individual)  # Пересечения грубого решения
+            annealing = SimulatedAnnealing(
+                dict(config, seed=self.rng.getrandbits(32), **stage)
+            )
+            annealing.cancel = self.cancel  # После отмены - одна эпоха на уровень
+            refined, _ = annealing.run(
+                np.array(individual, dtype=np.int64).reshape(-1, 3)
+            )
+            self.evaluations += annealing.evaluations
+            reasons.append(annealing.run_stats["stop_reason"])
+            placements = np.array(refined[0], dtype=np.int64).reshape(-1, 3)
+            fitness_list.append(refined[0].fitness.values[0])
+
+        individual = creator.Individual(placements.reshape(-1).tolist())
+        individual.fitness.values = (
+            float(
+                evaluate_population(self.problem, placements[None], self.collision)[0]
+            ),
+        )
+        if self.cancel is not None and self.cancel.is_set():
+            reason = "cancelled"
+        elif "time_budget" in reasons:
+            reason = "time_budget"
+        else:
+            reason = "generations"  # Пройдены все уровни
+        self.run_stats = {
+            **ga.run_stats,  # Статистика ГА грубого уровня (поколения, кэш и т.д.)
+            "evaluations": self.evaluations,
+            "levels": len(levels),
+            "coarse_components": len(coarsest["components"]),
+            "stop_reason": reason,
+            "elapsed": time.perf_counter() - started,
+        }
+        return [individual], fitness_list
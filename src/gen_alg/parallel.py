@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.gen_alg.evaluation import (
+    OUT_OF_BOARD_PENALTY,
+    OVERLAP_PENALTY,
+    evaluate_population,
+)
+from src.gen_alg.jit_kernels import NUMBA_AVAILABLE, evaluate_batch_kernel
+from src.gen_alg.problem import ProblemSpec
+
+_worker_state = {}  # Данные задачи внутри процесса-исполнителя
+
+
+def _init_worker(shm_name, n_components, n_connections, board, collision, backend):
+    """Инициализация исполнителя: подключение к разделяемой памяти с массивами задачи"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    data = np.ndarray(
+        (2 * n_components + 2 * n_connections,), dtype=np.int64, buffer=shm.buf
+    )
+    widths, heights, conn_a, conn_b = np.split(
+        data, [n_components, 2 * n_components, 2 * n_components + n_connections]
+    )
+    _worker_state["shm"] = shm  # Держим ссылку, пока жив процесс
+    _worker_state["problem"] = ProblemSpec.from_arrays(
+        *board, widths, heights, conn_a, conn_b
+    )
+    _worker_state["collision"] = collision
+    _worker_state["jit"] = backend == "numba" and NUMBA_AVAILABLE
+
+
+def _evaluate_chunk(genomes: np.ndarray) -> np.ndarray:
+    """Оценка пакета геномов (K x 3N) внутри исполнителя"""
+    problem = _worker_state["problem"]
+    collision = _worker_state["collision"]
+    if _worker_state["jit"]:
+        return evaluate_batch_kernel(
+            genomes.astype(np.int64),
+            problem.widths,
+            problem.heights,
+            problem.conn_a,
+            problem.conn_b,
+            problem.board_width,
+            problem.board_height,
+            collision == "sweep",
+            OVERLAP_PENALTY,
+            OUT_OF_BOARD_PENALTY,
+        )
+    return evaluate_population(problem, genomes, collision)
+
+
+class ParallelEvaluator:
+    """Пул процессов для оценки особей; массивы задачи передаются через shared memory"""
+
+    def __init__(
+        self,
+        problem: ProblemSpec,
+        collision: str = "brute",
+        backend: str = "python",
+        workers: int = 0,
+        chunk_size: int = 0,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        # Один общий блок памяти: [widths | heights | conn_a | conn_b]
+        data = np.concatenate(
+            [problem.widths, problem.heights, problem.conn_a, problem.conn_b]
+        )
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+        np.ndarray(data.shape, dtype=np.int64, buffer=self.shm.buf)[:] = data
+
+        self.pool = multiprocessing.get_context().Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(
+                self.shm.name,
+                problem.n_components,
+                problem.n_connections,
+                (problem.board_width, problem.board_height),
+                collision,
+                backend,
+            ),
+        )
+        self.closed = False
+
+    def map(self, func, iterable):
+        """Аналог встроенного map на пуле процессов; func должна передаваться
+        в исполнители (функция уровня модуля), для особей - evaluate_population"""
+        items = list(iterable)
+        chunksize = self.chunk_size or max(1, len(items) // (self.workers * 4))
+        return self.pool.map(func, items, chunksize=chunksize)
+
+    def evaluate_population(self, individuals: list) -> list[tuple[float,]]:
+        """Оценка особей пакетами: каждому исполнителю уходит массив геномов"""
+        if not individuals:
+            return []
+        genomes = np.array(individuals, dtype=np.int32)
+        chunk = self.chunk_size or -(-len(genomes) // self.workers)
+        chunks = [genomes[i : i + chunk] for i in range(0, len(genomes), chunk)]
+        fitnesses = np.concatenate(self.pool.map(_evaluate_chunk, chunks, chunksize=1))
+        return [(fit,) for fit in fitnesses]
+
+    def close(self) -> None:
+        """Остановка исполнителей и освобождение разделяемой памяти"""
+        if self.closed:
+            return
+        self.closed = True
+        self.pool.terminate()
+        self.pool.join()
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
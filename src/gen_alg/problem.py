@@ -0,0 +1,112 @@
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def _frozen(values, dtype=np.int64) -> np.ndarray:
+    """Непрерывный массив только для чтения"""
+    array = np.ascontiguousarray(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class ProblemSpec:
+    """Неизменяемое описание задачи размещения, собранное из конфига один раз"""
+
+    board_width: int
+    board_height: int
+    widths: np.ndarray  # Ширины компонентов без поворота, (N,)
+    heights: np.ndarray  # Высоты компонентов без поворота, (N,)
+    rotated_widths: np.ndarray  # Ширины: [0] - без поворота, [1] - с ним, (2, N)
+    rotated_heights: np.ndarray  # Высоты по значению поворота, (2, N)
+    conn_a: np.ndarray  # Первые концы соединений, (C,)
+    conn_b: np.ndarray  # Вторые концы соединений, (C,)
+    adjacency_ptr: np.ndarray  # CSR: соединения i - adjacency[ptr[i]:ptr[i+1]]
+    adjacency: np.ndarray  # Индексы соединений, упорядоченные по компонентам
+    content_hash: str  # Стабильный хэш содержимого задачи
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ProblemSpec":
+        """Компиляция конфига в массивы"""
+        connections = np.array(config["connections"], dtype=np.int64).reshape(-1, 2)
+        return cls.from_arrays(
+            config["board_width"],
+            config["board_height"],
+            [comp["width"] for comp in config["components"]],
+            [comp["height"] for comp in config["components"]],
+            connections[:, 0],
+            connections[:, 1],
+        )
+
+    @classmethod
+    def from_arrays(
+        cls, board_width, board_height, widths, heights, conn_a, conn_b
+    ) -> "ProblemSpec":
+        """Сборка задачи из готовых массивов размеров и концов соединений"""
+        widths = np.asarray(widths, dtype=np.int64)
+        heights = np.asarray(heights, dtype=np.int64)
+        conn_a = np.asarray(conn_a, dtype=np.int64)
+        conn_b = np.asarray(conn_b, dtype=np.int64)
+        n_components = len(widths)
+
+        # Список инцидентных соединений для каждого компонента (петли - один раз)
+        incident = [[] for _ in range(n_components)]
+        for k, (a, b) in enumerate(zip(conn_a.tolist(), conn_b.tolist())):
+            incident[a].append(k)
+            if b != a:
+                incident[b].append(k)
+        adjacency_ptr = np.zeros(n_components + 1, dtype=np.int64)
+        adjacency_ptr[1:] = np.cumsum([len(edges) for edges in incident])
+        adjacency = [k for edges in incident for k in edges]
+
+        digest = hashlib.sha256()
+        digest.update(
+            np.array(
+                [board_width, board_height, n_components], dtype=np.int64
+            ).tobytes()
+        )
+        for array in (widths, heights, np.stack([conn_a, conn_b], axis=1)):
+            digest.update(np.ascontiguousarray(array).tobytes())
+
+        return cls(
+            board_width=int(board_width),
+            board_height=int(board_height),
+            widths=_frozen(widths),
+            heights=_frozen(heights),
+            rotated_widths=_frozen([widths, heights]).reshape(2, n_components),
+            rotated_heights=_frozen([heights, widths]).reshape(2, n_components),
+            conn_a=_frozen(conn_a),
+            conn_b=_frozen(conn_b),
+            adjacency_ptr=_frozen(adjacency_ptr),
+            adjacency=_frozen(adjacency),
+            content_hash=digest.hexdigest(),
+        )
+
+    @property
+    def n_components(self) -> int:
+        return len(self.widths)
+
+    @property
+    def n_connections(self) -> int:
+        return len(self.conn_a)
+
+    def sizes(self, rotations) -> tuple[np.ndarray, np.ndarray]:
+        """Размеры компонентов с учётом поворота (любой ненулевой ген - поворот)"""
+        rotated = (np.asarray(rotations) != 0).astype(np.intp)
+        columns = np.arange(self.n_components)
+        return (
+            self.rotated_widths[rotated, columns],
+            self.rotated_heights[rotated, columns],
+        )
+
+    def incident_connections(self, components) -> np.ndarray:
+        """Индексы соединений, инцидентных заданным компонентам, без повторов"""
+        parts = [
+            self.adjacency[self.adjacency_ptr[c] : self.adjacency_ptr[c + 1]]
+            for c in components
+        ]
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(parts))
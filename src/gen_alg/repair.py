@@ -0,0 +1,107 @@
+import random
+
+import numpy as np
+
+from src.gen_alg.collision import count_overlaps_sweep
+from src.gen_alg.problem import ProblemSpec
+from src.gen_alg.seeding import Occupancy
+
+MUTATIONS = ("uniform", "bounded")  # Допустимые значения ключа "mutation"
+
+
+def position_bounds(problem: ProblemSpec) -> tuple[list, list]:
+    """Наибольшие допустимые x и y для каждого поворота: списки 2 x N"""
+    max_x = np.maximum(problem.board_width - problem.rotated_widths, 0)
+    max_y = np.maximum(problem.board_height - problem.rotated_heights, 0)
+    return max_x.tolist(), max_y.tolist()
+
+
+def mut_bounded_int(
+    individual: list, problem: ProblemSpec, indpb: float, rng: random.Random
+) -> tuple:
+    """Мутация координат в пределах платы с учётом размеров повёрнутого компонента"""
+    max_x, max_y = position_bounds(problem)
+    for c in range(problem.n_components):
+        rotated = int(individual[3 * c + 2] != 0)
+        if rng.random() < indpb:
+            individual[3 * c] = rng.randint(0, max_x[rotated][c])
+        if rng.random() < indpb:
+            individual[3 * c + 1] = rng.randint(0, max_y[rotated][c])
+    return (individual,)
+
+
+def mut_rotation_bounded(
+    individual: list, problem: ProblemSpec, indpb: float, rng: random.Random
+) -> tuple:
+    """Мутация поворота: ген остаётся 0/1, координаты сдвигаются внутрь платы"""
+    max_x, max_y = position_bounds(problem)
+    for c in range(problem.n_components):
+        if rng.random() < indpb:
+            rotated = 1 - int(individual[3 * c + 2] != 0)
+            individual[3 * c + 2] = rotated
+            individual[3 * c] = min(max(individual[3 * c], 0), max_x[rotated][c])
+            individual[3 * c + 1] = min(
+                max(individual[3 * c + 1], 0), max_y[rotated][c]
+            )
+    return (individual,)
+
+
+class Repairer:
+    """Восстановление допустимости: компоненты за платой и пересекающиеся
+    переносятся в ближайшую свободную позицию"""
+
+    def __init__(self, problem: ProblemSpec):
+        self.problem = problem
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.repaired_individuals = 0  # Особей, в которых что-то сдвинуто
+        self.repaired_components = 0  # Сдвинутых компонентов
+        self.unresolved_components = 0  # Компонентов, для которых нет свободного места
+
+    def repair(self, individual) -> tuple:
+        """Сдвиг компонентов особи на месте; поворот не меняется"""
+        problem = self.problem
+        genome = np.array(individual, dtype=np.int64).reshape(-1, 3)
+        x, y = genome[:, 0], genome[:, 1]
+        w, h = problem.sizes(genome[:, 2])
+
+        # Выход за плату: прижимаем к ближайшему краю
+        fits = (w <= problem.board_width) & (h <= problem.board_height)
+        new_x = np.clip(x, 0, np.maximum(problem.board_width - w, 0))
+        new_y = np.clip(y, 0, np.maximum(problem.board_height - h, 0))
+
+        # Пересечения: компоненты занимают сетку платы по порядку, а
+        # конфликтующий переносится в ближайшую свободную позицию
+        if count_overlaps_sweep(new_x, new_y, w, h):
+            occupancy = Occupancy(problem.board_width, problem.board_height)
+            for c in np.flatnonzero(fits).tolist():
+                cw, ch = int(w[c]), int(h[c])
+                cx, cy = int(new_x[c]), int(new_y[c])
+                if occupancy.overlaps(cx, cy, cw, ch):
+                    ys, xs = np.nonzero(occupancy.free_positions(cw, ch))
+                    if not len(xs):
+                        self.unresolved_components += 1
+                        continue
+                    nearest = int(np.argmin((xs - cx) ** 2 + (ys - cy) ** 2))
+                    cx, cy = int(xs[nearest]), int(ys[nearest])
+                    new_x[c], new_y[c] = cx, cy
+                occupancy.add(cx, cy, cw, ch)
+        self.unresolved_components += int(np.count_nonzero(~fits))
+
+        moved = np.flatnonzero((new_x != x) | (new_y != y))
+        if len(moved):
+            self.repaired_individuals += 1
+            self.repaired_components += len(moved)
+            for c in moved.tolist():
+                individual[3 * c] = int(new_x[c])
+                individual[3 * c + 1] = int(new_y[c])
+        return (individual,)
+
+    def stats(self) -> dict:
+        """Статистика восстановления для run_stats"""
+        return {
+            "repaired_individuals": self.repaired_individuals,
+            "repaired_components": self.repaired_components,
+            "unresolved_components": self.unresolved_components,
+        }
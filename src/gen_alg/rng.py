@@ -0,0 +1,58 @@
+import random
+from operator import attrgetter
+
+import numpy as np
+
+from src.utils.base_config import base_config
+
+
+def make_rng(config: dict) -> random.Random:
+    """Собственный генератор запуска, инициализированный ключом "seed" конфига"""
+    return random.Random(config.get("seed", base_config["seed"]))
+
+
+def spawn_seeds(seed: int, n: int) -> list[int]:
+    """Независимые зёрна для n дочерних потоков (острова, исполнители)"""
+    children = np.random.SeedSequence(seed).spawn(n)
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+
+# Операторы повторяют tools.cxTwoPoint, tools.mutUniformInt и tools.selTournament
+# из DEAP, но берут случайные числа из переданного генератора, а не из модуля random
+
+
+def cx_two_point(ind1: list, ind2: list, rng: random.Random) -> tuple:
+    """Двухточечный кроссовер"""
+    size = min(len(ind1), len(ind2))
+    cxpoint1 = rng.randint(1, size)
+    cxpoint2 = rng.randint(1, size - 1)
+    if cxpoint2 >= cxpoint1:
+        cxpoint2 += 1
+    else:  # Меняем точки местами
+        cxpoint1, cxpoint2 = cxpoint2, cxpoint1
+    ind1[cxpoint1:cxpoint2], ind2[cxpoint1:cxpoint2] = (
+        ind2[cxpoint1:cxpoint2],
+        ind1[cxpoint1:cxpoint2],
+    )
+    return ind1, ind2
+
+
+def mut_uniform_int(
+    individual: list, low: int, up: int, indpb: float, rng: random.Random
+) -> tuple:
+    """Равномерная целочисленная мутация генов в диапазоне [low, up]"""
+    for i in range(len(individual)):
+        if rng.random() < indpb:
+            individual[i] = rng.randint(low, up)
+    return (individual,)
+
+
+def sel_tournament(
+    individuals: list, k: int, tournsize: int, rng: random.Random
+) -> list:
+    """Турнирный отбор k особей"""
+    chosen = []
+    for _ in range(k):
+        aspirants = [rng.choice(individuals) for _ in range(tournsize)]
+        chosen.append(max(aspirants, key=attrgetter("fitness")))
+    return chosen
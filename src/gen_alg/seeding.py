@@ -0,0 +1,149 @@
+import random
+
+import numpy as np
+
+from src.gen_alg.problem import ProblemSpec
+
+SEEDING_ORDERS = ("area", "connectivity")  # Допустимые значения "seeding_order"
+
+
+def component_order(problem: ProblemSpec, order: str, rng: random.Random) -> list[int]:
+    """Порядок укладки: крупные компоненты первыми либо обход графа связей"""
+    areas = (problem.widths * problem.heights).tolist()
+    if order == "area":  # Площадь с небольшим шумом, чтобы раскладки различались
+        return sorted(
+            range(problem.n_components),
+            key=lambda c: areas[c] * rng.uniform(0.8, 1.2),
+            reverse=True,
+        )
+    if order != "connectivity":
+        raise ValueError(f"Неизвестный порядок: {order}. Допустимо: {SEEDING_ORDERS}")
+
+    # Обход в ширину от самых связанных компонентов: соседи по связям
+    # оказываются рядом в порядке укладки и размещаются друг возле друга
+    degree = np.diff(problem.adjacency_ptr).tolist()
+    remaining = sorted(
+        range(problem.n_components),
+        key=lambda c: (degree[c], rng.random()),
+        reverse=True,
+    )
+    order_list, seen = [], set()
+    for root in remaining:
+        if root in seen:
+            continue
+        seen.add(root)
+        queue = [root]
+        while queue:
+            component = queue.pop(0)
+            order_list.append(component)
+            neighbors = set()
+            for k in problem.incident_connections([component]).tolist():
+                neighbors.update((int(problem.conn_a[k]), int(problem.conn_b[k])))
+            for neighbor in sorted(neighbors - seen, key=lambda c: -degree[c]):
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return order_list
+
+
+class Occupancy:
+    """Занятость сетки платы и маски свободных позиций по размерам прямоугольника
+
+    Маска для размера строится по таблице сумм (summed-area table) при первом
+    запросе, а затем обновляется на месте при каждой укладке: гасятся только
+    углы, чьё окно задевает новый прямоугольник. Поэтому укладка N компонентов
+    не пересчитывает таблицу по всей плате для каждого из них
+    """
+
+    def __init__(self, board_width: int, board_height: int):
+        self.board_width = board_width
+        self.board_height = board_height
+        self.occupied = np.zeros((board_height, board_width), dtype=bool)
+        self.masks = {}  # (ширина, высота) -> маска свободных углов (y, x)
+
+    def add(self, x: int, y: int, width: int, height: int) -> None:
+        """Занять прямоугольник и погасить затронутые им углы во всех масках"""
+        self.occupied[y : y + height, x : x + width] = True
+        for (mask_width, mask_height), mask in self.masks.items():
+            mask[
+                max(y - mask_height + 1, 0) : y + height,
+                max(x - mask_width + 1, 0) : x + width,
+            ] = False
+
+    def overlaps(self, x: int, y: int, width: int, height: int) -> bool:
+        """Есть ли занятые клетки в прямоугольнике"""
+        return bool(self.occupied[y : y + height, x : x + width].any())
+
+    def free_positions(self, width: int, height: int) -> np.ndarray:
+        """Маска допустимых левых верхних углов (y, x) для прямоугольника width x height"""
+        if width > self.board_width or height > self.board_height:
+            return np.zeros((0, 0), dtype=bool)
+        mask = self.masks.get((width, height))
+        if mask is None:
+            table = np.zeros((self.board_height + 1, self.board_width + 1), np.int64)
+            table[1:, 1:] = self.occupied.cumsum(axis=0).cumsum(axis=1)  # Таблица сумм
+            window = (
+                table[height:, width:]
+                - table[:-height, width:]
+                - table[height:, :-width]
+                + table[:-height, :-width]
+            )
+            mask = self.masks[width, height] = window == 0
+        return mask
+
+
+def pack_layout(
+    problem: ProblemSpec, rng: random.Random, order: str = "connectivity"
+) -> list[int] | None:
+    """Раскладка без пересечений и выхода за плату; None, если компонент не поместился
+
+    "area" - bottom-left fill от случайного угла платы, "connectivity" - жадное
+    размещение рядом с уже уложенными соседями по связям
+    """
+    occupancy = Occupancy(problem.board_width, problem.board_height)
+    genome = [0] * (3 * problem.n_components)
+    centers = {}  # Компонент -> центр уложенного прямоугольника
+    flip_x, flip_y = rng.choice((1, -1)), rng.choice((1, -1))  # Угол укладки
+
+    for component in component_order(problem, order, rng):
+        neighbors = set()
+        for k in problem.incident_connections([component]).tolist():
+            neighbors.update((int(problem.conn_a[k]), int(problem.conn_b[k])))
+        placed = [centers[c] for c in neighbors if c in centers and c != component]
+
+        best = None  # (стоимость, x, y, поворот)
+        for rot in rng.sample((0, 1), 2):  # Случайный порядок поворотов
+            width = int(problem.rotated_widths[rot, component])
+            height = int(problem.rotated_heights[rot, component])
+            free = occupancy.free_positions(width, height)
+            if order == "connectivity" and placed:
+                ys, xs = np.nonzero(free)
+                if not len(xs):
+                    continue
+                cx, cy = xs + width / 2, ys + height / 2
+                cost = sum(
+                    ((cx - px) ** 2 + (cy - py) ** 2) ** 0.5 for px, py in placed
+                )
+                index = int(np.argmin(cost))
+                candidate = (float(cost[index]), xs[index], ys[index], rot)
+            else:  # Первая позиция от выбранного угла: по y, затем по x
+                rows = np.flatnonzero(free.any(axis=1))
+                if not len(rows):
+                    continue
+                y = rows[0] if flip_y > 0 else rows[-1]
+                columns = np.flatnonzero(free[y])
+                x = columns[0] if flip_x > 0 else columns[-1]
+                candidate = (0.0, x, y, rot)
+            if best is None or candidate[0] < best[0]:
+                best = candidate
+            if order == "area" or not placed:
+                break  # Без соседей сравнивать повороты не с чем
+        if best is None:
+            return None
+
+        _, x, y, rot = best
+        width = int(problem.rotated_widths[rot, component])
+        height = int(problem.rotated_heights[rot, component])
+        occupancy.add(int(x), int(y), width, height)
+        centers[component] = (x + width / 2, y + height / 2)
+        genome[3 * component : 3 * component + 3] = [int(x), int(y), rot]
+    return genome
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import threading
+import weakref
+
+import numpy as np
+
+
+def genome_dtype(board_width: int, board_height: int) -> np.dtype:
+    """Наименьший целочисленный тип, вмещающий координаты платы"""
+    limit = np.iinfo(np.int16).max
+    return np.dtype(np.int16 if max(board_width, board_height) <= limit else np.int32)
+
+
+def _remove(path: str) -> None:
+    """Удаление временного файла снимков (в том числе при сборке мусора)"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class SnapshotStore:
+    """Снимки лучших особей поколений с ограниченной памятью
+
+    Последние capacity снимков лежат в заранее выделенном кольцевом буфере,
+    более старые дописываются в файл на диске и читаются через np.memmap.
+    Индексация сквозная: store[i] -> (геном, поколение, значение функции).
+    Запись из потока ГА и чтение из потока интерфейса защищены блокировкой
+    """
+
+    def __init__(
+        self,
+        n_genes: int,
+        capacity: int,
+        dtype=np.int32,
+        spill_path: str | None = None,
+    ):
+        if capacity < 1:
+            raise ValueError("Ёмкость буфера снимков должна быть не меньше 1")
+        self.record = np.dtype(
+            [
+                ("generation", np.int64),
+                ("fitness", np.float64),
+                ("genome", dtype, (n_genes,)),
+            ]
+        )
+        self.capacity = capacity
+        self.ring = np.zeros(capacity, dtype=self.record)
+        self.spill_path = spill_path  # None - временный файл при первом вытеснении
+        self.temporary = None  # Удаление временного файла (weakref.finalize)
+        self.spill_file = None
+        self.spill_map = None  # Отображение файла; пересоздаётся при его росте
+        self.lock = threading.Lock()
+        self.spilled = 0  # Снимков в файле
+        self.buffered = 0  # Снимков в кольцевом буфере
+        self.head = 0  # Позиция самого старого снимка в буфере
+
+    def __len__(self) -> int:
+        return self.spilled + self.buffered
+
+    def append(self, genome, generation: int, fitness: float) -> None:
+        with self.lock:
+            if self.buffered == self.capacity:  # Самый старый снимок - на диск
+                self._spill(self.ring[self.head])
+                self.head = (self.head + 1) % self.capacity
+                self.buffered -= 1
+            slot = self.ring[(self.head + self.buffered) % self.capacity]
+            slot["generation"] = generation
+            slot["fitness"] = fitness
+            slot["genome"] = genome
+            self.buffered += 1
+
+    def _spill(self, record) -> None:
+        if self.spill_file is None:
+            if self.spill_path is None:
+                fd, self.spill_path = tempfile.mkstemp(suffix=".snapshots")
+                os.close(fd)
+                self.temporary = weakref.finalize(self, _remove, self.spill_path)
+            self.spill_file = open(self.spill_path, "w+b")
+        self.spill_file.write(record.tobytes())
+        self.spilled += 1
+
+    def __getitem__(self, index: int) -> tuple[np.ndarray, int, float]:
+        with self.lock:
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("Нет снимка с таким номером")
+            if index >= self.spilled:
+                record = self.ring[
+                    (self.head + index - self.spilled) % self.capacity
+                ].copy()
+            else:
+                record = self._spilled_map()[index].copy()
+        return record["genome"], int(record["generation"]), float(record["fitness"])
+
+    def _spilled_map(self) -> np.memmap:
+        """Файл вытесненных снимков, отображённый в память по требованию"""
+        if self.spill_map is None or len(self.spill_map) != self.spilled:
+            self.spill_file.flush()
+            self.spill_map = np.memmap(
+                self.spill_path, dtype=self.record, mode="r", shape=(self.spilled,)
+            )
+        return self.spill_map
+
+    def clear(self) -> None:
+        """Удаление всех снимков перед новым запуском"""
+        with self.lock:
+            self.spilled = self.buffered = self.head = 0
+            self.spill_map = None
+            if self.spill_file is not None:
+                self.spill_file.seek(0)
+                self.spill_file.truncate()
+
+    def close(self) -> None:
+        """Удаление всех снимков и закрытие файла; временный файл удаляется"""
+        self.clear()
+        with self.lock:
+            if self.spill_file is not None:
+                self.spill_file.close()
+                self.spill_file = None
+            if self.temporary is not None:
+                self.temporary()
+                self.temporary = self.spill_path = None
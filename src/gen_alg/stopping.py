@@ -0,0 +1,65 @@
+import time
+
+from src.utils.base_config import base_config
+
+
+class StoppingCriteria:
+    """Критерии досрочной остановки: стагнация, целевое значение, бюджет времени
+    и отмена запуска извне (например, кнопкой в интерфейсе)"""
+
+    def __init__(self, config: dict, cancel=None):
+        self.max_generations = config["generations"]
+        self.stagnation_generations = config.get(
+            "stagnation_generations", base_config["stagnation_generations"]
+        )
+        self.stagnation_tolerance = config.get(
+            "stagnation_tolerance", base_config["stagnation_tolerance"]
+        )
+        self.target_fitness = config.get(
+            "target_fitness", base_config["target_fitness"]
+        )
+        self.time_budget = config.get("time_budget", base_config["time_budget"])
+        self.cancel = cancel  # threading.Event или None
+        self.start()
+
+    def start(self) -> None:
+        """Сброс состояния перед запуском"""
+        self.started = time.perf_counter()
+        self.best = float("inf")
+        self.last_improvement = 0
+        self.generations = 0
+        self.reason = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def check(self, generation: int, best_fitness: float) -> str | None:
+        """Учёт лучшего значения поколения; возвращает сработавший критерий или None"""
+        self.generations = generation
+        if best_fitness < self.best - self.stagnation_tolerance:
+            self.last_improvement = generation
+        self.best = min(self.best, best_fitness)
+
+        if self.cancel is not None and self.cancel.is_set():
+            self.reason = "cancelled"
+        elif self.target_fitness is not None and self.best <= self.target_fitness:
+            self.reason = "target_fitness"
+        elif (
+            self.stagnation_generations
+            and generation - self.last_improvement >= self.stagnation_generations
+        ):
+            self.reason = "stagnation"
+        elif self.time_budget is not None and self.elapsed >= self.time_budget:
+            self.reason = "time_budget"
+        elif generation >= self.max_generations:
+            self.reason = "generations"
+        return self.reason
+
+    def stats(self) -> dict:
+        """Итог для статистики запуска"""
+        return {
+            "stop_reason": self.reason or "generations",
+            "generations": self.generations,
+            "elapsed": self.elapsed,
+        }
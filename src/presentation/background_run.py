@@ -0,0 +1,41 @@
+import queue
+import threading
+
+UI_FPS = 10  # Наибольшая частота обновления интерфейса во время запуска
+
+
+class BackgroundRun:
+    """Запуск оптимизатора в фоновом потоке
+
+    Поток не трогает Tk: сообщения журнала, результат и ошибка передаются
+    через очередь, которую интерфейс разбирает через after() не чаще UI_FPS
+    раз в секунду. Отмена - событие, которое оптимизатор проверяет раз в
+    поколение и после которого возвращает лучшее найденное
+    """
+
+    def __init__(self, target):
+        self.events = queue.Queue()
+        self.cancel = threading.Event()
+        self.thread = threading.Thread(target=self._work, args=(target,), daemon=True)
+
+    def _work(self, target) -> None:
+        try:
+            self.events.put(("done", target(self.log)))
+        except Exception as e:  # Ошибка показывается в консоли окна
+            self.events.put(("error", e))
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def log(self, message: str) -> None:
+        """Функция log для оптимизатора: вызывается из фонового потока"""
+        self.events.put(("log", message))
+
+    def drain(self) -> list[tuple]:
+        """Все накопившиеся события (вид, значение) без ожидания"""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
@@ -0,0 +1,166 @@
+import tkinter as tk
+
+import numpy as np
+
+from src.gen_alg.collision import overlapping_pairs
+from src.gen_alg.problem import ProblemSpec
+
+ZOOM_STEP = 1.25  # Множитель масштаба за один шаг колеса мыши
+MIN_PIXELS = 2  # Компоненты меньше этого размера на экране не рисуются
+LABEL_PIXELS = 24  # Подписи - только у компонентов не меньше этого размера
+GRID_PIXELS = 8  # Сетка клеток - только при клетке не меньше этого размера
+
+COMPONENT_FILL = "#9ecae1"
+ROTATED_FILL = "#c6dbef"
+OVERLAP_FILL = "#fb6a4a"
+OUT_OF_BOARD_OUTLINE = "#ff7f00"
+
+
+class BoardCanvas:
+    """Плата на tk.Canvas: один прямоугольник на компонент
+
+    Пересечения считаются геометрически (sort-and-sweep), а не по клеткам.
+    Колесо мыши - масштаб вокруг курсора, перетаскивание - сдвиг, двойной
+    щелчок - вписать плату. Рисуются только компоненты в видимой области и
+    не меньше MIN_PIXELS на экране (пересекающиеся - всегда), поэтому время
+    отрисовки зависит от числа видимых компонентов, а не от числа клеток
+    """
+
+    def __init__(self, parent, problem: ProblemSpec, **kwargs):
+        self.problem = problem
+        self.canvas = tk.Canvas(parent, background="white", **kwargs)
+        self.scale = None  # Пикселей на клетку; None - вписать при отрисовке
+        self.origin = (0.0, 0.0)  # Экранные координаты угла (0, 0) платы
+        self.drag_start = None
+        self.render_pending = None
+        self.placements = None
+
+        self.canvas.bind("<Configure>", lambda event: self.schedule_render())
+        self.canvas.bind("<MouseWheel>", self.on_wheel)  # Windows, macOS
+        self.canvas.bind("<Button-4>", lambda event: self.zoom(event, ZOOM_STEP))
+        self.canvas.bind("<Button-5>", lambda event: self.zoom(event, 1 / ZOOM_STEP))
+        self.canvas.bind("<ButtonPress-1>", self.on_press)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<Double-Button-1>", lambda event: self.fit())
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def show(self, placements: np.ndarray) -> None:
+        """Новая раскладка (N x 3): размеры и пересечения считаются один раз"""
+        placements = np.asarray(placements, dtype=np.int64).reshape(-1, 3)
+        self.placements = placements
+        self.x, self.y = placements[:, 0], placements[:, 1]
+        self.rotated = placements[:, 2] != 0
+        self.w, self.h = self.problem.sizes(placements[:, 2])
+        first, second = overlapping_pairs(self.x, self.y, self.w, self.h)
+        self.overlapping = np.zeros(len(placements), dtype=bool)
+        self.overlapping[first] = True
+        self.overlapping[second] = True
+        self.out_of_board = (self.x + self.w > self.problem.board_width) | (
+            self.y + self.h > self.problem.board_height
+        )
+        self.schedule_render()
+
+    def fit(self) -> None:
+        """Масштаб, при котором плата целиком помещается в холст"""
+        self.scale = None
+        self.schedule_render()
+
+    def schedule_render(self) -> None:
+        """Отрисовка откладывается до простоя: серия событий - один кадр"""
+        if self.render_pending is None:
+            self.render_pending = self.canvas.after_idle(self.render)
+
+    def render(self) -> None:
+        self.render_pending = None
+        self.canvas.delete("all")
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        board_w, board_h = self.problem.board_width, self.problem.board_height
+        if width <= 1 or height <= 1:
+            return  # Холст ещё не размещён; отрисовка будет по <Configure>
+        if self.scale is None:
+            self.scale = max(min(width / board_w, height / board_h) * 0.95, 1e-3)
+            self.origin = (
+                (width - board_w * self.scale) / 2,
+                (height - board_h * self.scale) / 2,
+            )
+        scale, (ox, oy) = self.scale, self.origin
+
+        self.canvas.create_rectangle(
+            ox, oy, ox + board_w * scale, oy + board_h * scale, outline="black"
+        )
+        if scale >= GRID_PIXELS:  # Сетка только в видимой части платы
+            first_x, last_x = self._visible_cells(ox, width, board_w)
+            first_y, last_y = self._visible_cells(oy, height, board_h)
+            for cell in range(first_x, last_x + 1):
+                sx = ox + cell * scale
+                self.canvas.create_line(
+                    sx, oy + first_y * scale, sx, oy + last_y * scale, fill="#eeeeee"
+                )
+            for cell in range(first_y, last_y + 1):
+                sy = oy + cell * scale
+                self.canvas.create_line(
+                    ox + first_x * scale, sy, ox + last_x * scale, sy, fill="#eeeeee"
+                )
+        if self.placements is None:
+            return
+
+        # Экранные прямоугольники всех компонентов - векторно, затем отсечение
+        x0, y0 = ox + self.x * scale, oy + self.y * scale
+        x1, y1 = x0 + self.w * scale, y0 + self.h * scale
+        visible = (x1 > 0) & (x0 < width) & (y1 > 0) & (y0 < height)
+        large = (x1 - x0 >= MIN_PIXELS) | (y1 - y0 >= MIN_PIXELS)
+        labelled = (x1 - x0 >= LABEL_PIXELS) & (y1 - y0 >= LABEL_PIXELS)
+        for idx in np.flatnonzero(visible & (large | self.overlapping)).tolist():
+            if self.overlapping[idx]:
+                fill = OVERLAP_FILL
+            else:
+                fill = ROTATED_FILL if self.rotated[idx] else COMPONENT_FILL
+            outline = OUT_OF_BOARD_OUTLINE if self.out_of_board[idx] else "#3182bd"
+            self.canvas.create_rectangle(
+                x0[idx],
+                y0[idx],
+                max(x1[idx], x0[idx] + 1),
+                max(y1[idx], y0[idx] + 1),
+                fill=fill,
+                outline=outline if large[idx] else "",
+            )
+            if labelled[idx]:
+                self.canvas.create_text(
+                    (x0[idx] + x1[idx]) / 2,
+                    (y0[idx] + y1[idx]) / 2,
+                    text=f"C{idx + 1}" + ("'" if self.rotated[idx] else ""),
+                )
+
+    def _visible_cells(self, origin: float, pixels: int, cells: int) -> tuple:
+        """Диапазон клеток платы по оси, попадающий на экран"""
+        first = int(max(0, -origin // self.scale))
+        last = int(min(cells, (pixels - origin) // self.scale + 1))
+        return first, max(first, last)
+
+    def zoom(self, event, factor: float) -> None:
+        """Масштаб вокруг точки под курсором"""
+        if self.scale is None:
+            return
+        ox, oy = self.origin
+        self.scale *= factor
+        self.origin = (
+            event.x - (event.x - ox) * factor,
+            event.y - (event.y - oy) * factor,
+        )
+        self.schedule_render()
+
+    def on_wheel(self, event) -> None:
+        self.zoom(event, ZOOM_STEP if event.delta > 0 else 1 / ZOOM_STEP)
+
+    def on_press(self, event) -> None:
+        self.drag_start = (event.x, event.y)
+
+    def on_drag(self, event) -> None:
+        if self.drag_start is None:
+            return
+        dx, dy = event.x - self.drag_start[0], event.y - self.drag_start[1]
+        self.drag_start = (event.x, event.y)
+        self.origin = (self.origin[0] + dx, self.origin[1] + dy)
+        self.schedule_render()
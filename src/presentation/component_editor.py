@@ -3,9 +3,10 @@ from tkinter import ttk
 
 
 class ComponentEditor:
-    def __init__(self, parent, config_manager, config):
+    def __init__(self, parent, config_manager, config, config_name):
         self.config_manager = config_manager
         self.config = config
+        self.config_name = config_name  # Имя для сохранения через config_manager
         self.window = tk.Toplevel(parent)
         self.window.title("Редактор компонентов и соединений")
         self.create_widgets()
@@ -75,25 +76,19 @@ class ComponentEditor:
     def open_connection_table(self):
         """Открывает окно с таблицей соединений"""
         # Сохраняем изменения компонентов
-        config_name = next(
-            (
-                name
-                for name, cfg in self.config_manager.configs.items()
-                if cfg == self.config
-            ),
-            None,
-        )
-        if config_name:
-            self.config_manager.update_config(config_name, self.config)
+        self.config_manager.update_config(self.config_name, self.config)
 
         self.window.destroy()
-        ConnectionTable(self.window.master, self.config_manager, self.config)
+        ConnectionTable(
+            self.window.master, self.config_manager, self.config, self.config_name
+        )
 
 
 class ConnectionTable:
-    def __init__(self, parent, config_manager, config):
+    def __init__(self, parent, config_manager, config, config_name):
         self.config_manager = config_manager
         self.config = config
+        self.config_name = config_name
         self.window = tk.Toplevel(parent)
         self.window.title("Таблица соединений")
         self.create_widgets()
@@ -170,16 +165,7 @@ class ConnectionTable:
             self.connection_buttons[j][i].config(text="✓")
 
         # Сохраняем изменения
-        config_name = next(
-            (
-                name
-                for name, cfg in self.config_manager.configs.items()
-                if cfg == self.config
-            ),
-            None,
-        )
-        if config_name:
-            self.config_manager.update_config(config_name, self.config)
+        self.config_manager.update_config(self.config_name, self.config)
 
     def on_done(self):
         """Закрывает окно"""
@@ -1,13 +1,19 @@
+import os
 import random
 import time
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, ttk
 
+from environments import RUNS_DB
+from src.gen_alg.engines import create_engine
 from src.gen_alg.genetic_algorithm import GeneticAlgorithm
+from src.presentation.background_run import UI_FPS, BackgroundRun
 from src.presentation.component_editor import ComponentEditor
+from src.presentation.live_plot import LiveFeed, LiveFitnessPlot
 from src.presentation.plot_window import PlotWindow
 from src.utils.config_manager import ConfigManager
 from src.utils.base_config import base_config
+from src.utils.run_store import RunStore
 
 
 class MainApp:
@@ -16,6 +22,7 @@ class MainApp:
         self.root.title("Конфигурации для размещения элементов")
         self.config_manager = ConfigManager()
         self.fitness = []
+        self.run_store = None  # База запусков открывается при первом запуске
         # Создание интерфейса
         self.create_widgets()
 
@@ -83,21 +90,10 @@ class MainApp:
 
     def create_new_config(self):
         """Создает новую конфигурацию"""
-        new_config_name = f"Конфигурация {len(self.config_manager.configs) + 1}"
-        self.config_manager.add_config(
-            new_config_name,
-            {
-                "board_width": base_config.BOARD_WIDTH,
-                "board_height": base_config.BOARD_HEIGHT,
-                "population_size": base_config.POPULATION_SIZE,
-                "generations": base_config.GENERATIONS,
-                "visualization_steps": base_config.VISUALIZATION_STEPS,
-                "cxpb": base_config.CXPB,
-                "mutpb": base_config.MUTPB,
-                "components": base_config.COMPONENTS,
-                "connections": base_config.CONNECTIONS,
-            },
+        new_config_name = (
+            f"Конфигурация {len(self.config_manager.get_config_names()) + 1}"
         )
+        self.config_manager.add_config(new_config_name)
         self.update_config_list()
         self.update_config_params()
 
@@ -199,6 +195,14 @@ class MainApp:
                 f"{config['board_width'] * 30}x{config['board_height'] * 30}"
             )  # Размер окна зависит от платы
 
+            # Кнопка отмены: оптимизатор останавливается после текущего поколения
+            self.cancel_button = tk.Button(ga_console, text="Отмена")
+            self.cancel_button.pack(side=tk.BOTTOM, pady=5)
+
+            # Живой график сходимости над консолью
+            self.plot_frame = ttk.Frame(ga_console)
+            self.plot_frame.pack(fill=tk.BOTH, expand=True)
+
             # Консоль для вывода
             self.console = scrolledtext.ScrolledText(
                 ga_console, wrap=tk.WORD, font=("Courier", 10)
@@ -209,26 +213,119 @@ class MainApp:
             self.run_ga(selected_config)
 
     def run_ga(self, config_name):
-        """Запускает генетический алгоритм и выводит результаты в консоль"""
+        """Запускает оптимизатор в фоновом потоке; вывод - через poll_ga"""
         config = self.config_manager.get_config(config_name)
-        ga = GeneticAlgorithm(config)
-
-        def log(message):
-            """Выводит сообщение в консоль"""
-            self.console.insert(tk.END, message + "\n")
-            self.console.see(tk.END)
-
-        try:
-            start_time = time.time()
-            pop, self.fitness = ga.run(
-                log, config["visualization_steps"]
-            )  # Передаем функцию log и шаги визуализации
-            stop_time = time.time()
-            log(f"\nФинальное поколение: {config['generations']}")
-            log("Генетический алгоритм завершён.")
-            log(f"Время выполнения: {stop_time - start_time}")
-        except Exception as e:
-            log(f"Ошибка: {str(e)}")
+        engine = config.get("engine", base_config["engine"])
+        resume_from = None
+        if engine == "ga":
+            ga = GeneticAlgorithm(config)  # ГА с окном просмотра поколений
+            checkpoint_path = config.get("checkpoint_path")
+            if (
+                checkpoint_path
+                and os.path.exists(checkpoint_path)
+                and messagebox.askyesno(
+                    "Контрольная точка",
+                    f"Найдена контрольная точка {checkpoint_path}. Продолжить запуск?",
+                )
+            ):
+                resume_from = checkpoint_path
+        else:
+            ga = create_engine(config)
+
+        if self.run_store is None:
+            self.run_store = RunStore(RUNS_DB)
+        recorder = LiveFeed(
+            self.run_store.start_run(config, engine, config_name)
+        )  # Точки поколений - на живой график и в базу запусков
+        ga.recorder = recorder
+        live_plot = LiveFitnessPlot(
+            self.plot_frame,
+            recorder,
+            config.get("live_plot_series", base_config["live_plot_series"]),
+        )
+
+        def target(log):
+            start_time = time.perf_counter()
+            if engine == "ga":
+                result = ga.run(
+                    log, config["visualization_steps"], resume_from
+                )  # Передаем функцию log, шаги визуализации и точку продолжения
+            else:
+                result = ga.run()
+            recorder.finish(result[0], ga.run_stats, time.perf_counter() - start_time)
+            return result
+
+        ga_run = BackgroundRun(target)
+        ga.cancel = ga_run.cancel
+        console, cancel_button = self.console, self.cancel_button
+        cancel_button.config(command=lambda: self.cancel_ga(ga_run, cancel_button))
+        ga_console = console.winfo_toplevel()
+        ga_console.protocol(
+            "WM_DELETE_WINDOW", lambda: self.close_ga(ga_run, ga_console)
+        )  # Закрытие окна консоли отменяет запуск
+        ga_run.start()
+        self.poll_ga(ga_run, ga, engine, console, cancel_button, live_plot, time.time())
+
+    def poll_ga(
+        self, ga_run, ga, engine, console, cancel_button, live_plot, start_time
+    ):
+        """Разбор событий фонового запуска с частотой не выше UI_FPS"""
+        messages = []
+        finished = False
+        for kind, value in ga_run.drain():
+            if kind == "log":
+                messages.append(value)
+            elif kind == "error":
+                messages.append(f"Ошибка: {str(value)}")
+                finished = True
+            else:
+                pop, self.fitness = value
+                if engine != "ga":
+                    messages.append(
+                        f"Лучшая оценка: {min(ind.fitness.values[0] for ind in pop)}"
+                    )
+                if "generations" in ga.run_stats:
+                    messages.append(
+                        f"\nФинальное поколение: {ga.run_stats['generations']}"
+                    )
+                    messages.append(
+                        f"Критерий остановки: {ga.run_stats['stop_reason']}"
+                    )
+                messages.append(f"Оптимизация ({engine}) завершена.")
+                messages.append(f"Время выполнения: {time.time() - start_time}")
+                finished = True
+
+        if console.winfo_exists():  # Окно консоли могли закрыть
+            if messages:  # Одна вставка в консоль за кадр
+                console.insert(tk.END, "\n".join(messages) + "\n")
+                console.see(tk.END)
+            live_plot.refresh()  # Только линии графика (blitting)
+            if engine == "ga":
+                ga.show_latest_generation()  # Перерисовка платы - не чаще кадра
+            if finished:
+                cancel_button.config(state=tk.DISABLED)
+        if not finished:
+            self.root.after(
+                1000 // UI_FPS,
+                self.poll_ga,
+                ga_run,
+                ga,
+                engine,
+                console,
+                cancel_button,
+                live_plot,
+                start_time,
+            )
+
+    def cancel_ga(self, ga_run, cancel_button):
+        """Отмена запуска: результатом станет лучшее найденное размещение"""
+        ga_run.cancel.set()
+        cancel_button.config(state=tk.DISABLED)
+
+    def close_ga(self, ga_run, ga_console):
+        """Закрытие окна консоли с отменой запуска"""
+        ga_run.cancel.set()
+        ga_console.destroy()
 
     def check_custom_layout(self):
         """Проверяет кастомное размещение"""
@@ -245,8 +342,13 @@ class MainApp:
 
     def open_plot_window(self):
         """Открывает окно для построения графиков"""
+        if self.run_store is None:
+            self.run_store = RunStore(RUNS_DB)
         PlotWindow(
-            parent=self.root, config_manager=self.config_manager, fitness=self.fitness
+            parent=self.root,
+            config_manager=self.config_manager,
+            fitness=self.fitness,
+            run_store=self.run_store,
         )
 
     def open_component_editor(self):
@@ -255,4 +357,4 @@ class MainApp:
         if selected_config:
             config = self.config_manager.get_config(selected_config)
             # Передаем config_manager в ComponentEditor
-            ComponentEditor(self.root, self.config_manager, config)
+            ComponentEditor(self.root, self.config_manager, config, selected_config)
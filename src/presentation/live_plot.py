@@ -0,0 +1,181 @@
+import threading
+import tkinter as tk
+
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+SERIES = ("best", "mean", "worst", "diversity")  # Допустимые ряды живого графика
+Y_MARGIN = 0.05  # Запас по оси Y при перестройке пределов
+
+
+def minmax_downsample(
+    x: np.ndarray, y: np.ndarray, buckets: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Прореживание кривой до двух точек (минимум и максимум) на корзину
+
+    Корзины - равные отрезки оси X (по пикселю на корзину), поэтому на экране
+    прореженная кривая совпадает с полной; x должен быть отсортирован
+    """
+    n = len(x)
+    if n <= 2 * buckets:
+        return x, y
+    edges = np.linspace(x[0], x[-1], buckets + 1)[:-1]
+    starts = np.unique(np.searchsorted(x, edges, side="left"))
+    ends = np.append(starts[1:], n)
+    low = np.minimum.reduceat(y, starts)
+    high = np.maximum.reduceat(y, starts)
+    falling = y[starts] > y[ends - 1]  # Порядок точек повторяет ход кривой
+    xs = np.column_stack((x[starts], x[ends - 1])).ravel()
+    ys = np.column_stack(
+        (np.where(falling, high, low), np.where(falling, low, high))
+    ).ravel()
+    return xs, ys
+
+
+class LiveFeed:
+    """Приёмник точек траектории из потока оптимизатора
+
+    Совместим с RunRecorder (record) и пересылает точки ему же, если он задан.
+    Точки лежат в растущем массиве numpy: запись - O(1) в среднем, чтение
+    из потока интерфейса не копирует списки
+    """
+
+    def __init__(self, forward=None):
+        self.forward = forward
+        self.lock = threading.Lock()
+        self.data = np.full((1024, 1 + len(SERIES)), np.nan)
+        self.count = 0
+
+    def record(
+        self,
+        generation: int,
+        best: float,
+        mean: float | None = None,
+        worst: float | None = None,
+        diversity: float | None = None,
+    ) -> None:
+        with self.lock:
+            if self.count == len(self.data):
+                grown = np.full((2 * len(self.data), self.data.shape[1]), np.nan)
+                grown[: self.count] = self.data
+                self.data = grown
+            self.data[self.count] = (
+                generation,
+                best,
+                np.nan if mean is None else mean,
+                np.nan if worst is None else worst,
+                np.nan if diversity is None else diversity,
+            )
+            self.count += 1
+        if self.forward is not None:
+            self.forward.record(generation, best, mean, worst, diversity)
+
+    def snapshot(self) -> np.ndarray:
+        """Накопленные точки: столбцы - поколение и ряды SERIES"""
+        with self.lock:
+            return self.data[: self.count]
+
+    def finish(self, *args) -> None:
+        """Итог запуска - только в пересылаемый RunRecorder"""
+        if self.forward is not None:
+            self.forward.finish(*args)
+
+
+class LiveFitnessPlot:
+    """Живой график сходимости с перерисовкой только линий (blitting)
+
+    Фон (оси, подписи) перерисуется лишь при выходе данных за пределы осей
+    или изменении размера окна; в остальных кадрах восстанавливается
+    сохранённый фон и рисуются только линии, прореженные до ширины осей
+    """
+
+    def __init__(self, parent, feed: LiveFeed, series=("best",)):
+        unknown = set(series) - set(SERIES)
+        if unknown:
+            raise ValueError(
+                f"Неизвестные ряды графика: {unknown}. Допустимо: {SERIES}"
+            )
+        self.feed = feed
+        self.figure = Figure(figsize=(5, 3))
+        self.axes = self.figure.add_subplot()
+        self.axes.set_xlabel("Поколение")
+        self.axes.set_ylabel("Целевая функция")
+        self.lines = {}
+        for name in series:
+            if name == "diversity":  # Своя шкала справа
+                axes = self.axes.twinx()
+                axes.set_ylabel("Разнообразие")
+            else:
+                axes = self.axes
+            (self.lines[name],) = axes.plot([], [], label=name, animated=True)
+            if name == "diversity":
+                self.lines[name].set_color("gray")
+        self.axes.legend(
+            [self.lines[name] for name in series], list(series), loc="upper right"
+        )
+        self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.background = None
+        self.drawn = 0  # Точек на момент последнего кадра
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.canvas.draw()
+
+    def on_draw(self, event) -> None:
+        """После полной перерисовки (в том числе при изменении размера)"""
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_lines()
+
+    def draw_lines(self) -> None:
+        for line in self.lines.values():
+            line.axes.draw_artist(line)
+
+    def refresh(self) -> None:
+        """Кадр: вызывается из потока Tk не чаще частоты интерфейса"""
+        data = self.feed.snapshot()
+        if len(data) == self.drawn or self.background is None:
+            return
+        self.drawn = len(data)
+        buckets = max(int(self.axes.bbox.width), 1)
+        ranges = {}  # Оси -> (последний x, минимум, максимум) их линий
+        for column, name in enumerate(SERIES, start=1):
+            if name not in self.lines:
+                continue
+            line = self.lines[name]
+            x, y = minmax_downsample(data[:, 0], data[:, column], buckets)
+            line.set_data(x, y)
+            finite = y[np.isfinite(y)]
+            if len(finite):
+                last, low, high = ranges.get(line.axes, (x[-1], np.inf, -np.inf))
+                ranges[line.axes] = (
+                    last,
+                    min(low, float(finite.min())),
+                    max(high, float(finite.max())),
+                )
+
+        rescale = False
+        for axes, (last, low, high) in ranges.items():
+            rescale |= self._rescale(axes, float(last), low, high)
+        if rescale:  # Полная перерисовка; фон сохранит on_draw
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            self.draw_lines()
+            self.canvas.blit(self.figure.bbox)
+
+    @staticmethod
+    def _rescale(axes, last: float, low: float, high: float) -> bool:
+        """Новые пределы, если кривые вышли за оси или сжались в полосу меньше
+        четверти высоты; X растёт с запасом вдвое. True - пределы изменены"""
+        (_, x_high), (y_low, y_high) = axes.get_xlim(), axes.get_ylim()
+        span = max(high - low, abs(high) * 1e-6, 1e-9)
+        if (
+            last <= x_high
+            and y_low <= low
+            and high <= y_high
+            and span * 4 >= y_high - y_low
+        ):
+            return False
+        axes.set_xlim(0, max(2 * last, 10))
+        axes.set_ylim(low - Y_MARGIN * span, high + Y_MARGIN * span)
+        return True
@@ -1,26 +1,57 @@
 import tkinter as tk
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 
-from src.utils.base_config import base_config
+MAX_RUNS = 200  # Последних запусков на конфигурацию на графике
 
 
 class PlotWindow:
-    def __init__(self, parent, config_manager, fitness: list):
+    def __init__(self, parent, config_manager, fitness: list, run_store=None):
         self.config_manager = config_manager
+        self.run_store = run_store
         self.window = tk.Toplevel(parent)
         self.window.title("Графики")
         self.fitness = fitness
         self.create_widgets()
 
     def create_widgets(self):
-        """Создает интерфейс окна"""
+        """Создает интерфейс окна: траектории запусков каждой конфигурации из базы
+        запусков, по одному набору линий (LineCollection) на конфигурацию"""
         fig, ax = plt.subplots()
-        for config_name in self.config_manager.get_config_names():
-            print(base_config.VISUALIZATION_STEPS, self.fitness)
-            ax.plot(base_config.VISUALIZATION_STEPS, self.fitness, label=config_name)
-        ax.legend()
+        plotted = False
+        colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+        for number, config_name in enumerate(self.config_manager.get_config_names()):
+            if self.run_store is None:
+                break
+            runs = self.run_store.runs(config_name=config_name, limit=MAX_RUNS)
+            trajectories = self.run_store.trajectories([run["id"] for run in runs])
+            segments = [
+                np.column_stack((points["generation"], points["best"]))
+                for points in trajectories.values()
+                if len(points["generation"])
+            ]
+            if not segments:
+                continue
+            ax.add_collection(
+                LineCollection(
+                    segments,
+                    colors=colors[number % len(colors)],
+                    alpha=0.6,
+                    label=f"{config_name} ({len(segments)})",
+                )
+            )
+            plotted = True
+        if not plotted and self.fitness:  # База пуста - последний запуск
+            ax.plot(self.fitness, label="Последний запуск")
+            plotted = True
+        if plotted:
+            ax.autoscale_view()
+            ax.set_xlabel("Поколение")
+            ax.set_ylabel("Лучшее значение целевой функции")
+            ax.legend()
         canvas = FigureCanvasTkAgg(fig, master=self.window)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
@@ -7,7 +7,40 @@ base_config = {
     "mutpb": 0.2,  # Вероятность мутации особи
     "indpb": 0.2,  # Вероятность вызова мутации поворота
     "seed": 42,  # Сид для генератора случайных чисел
+    "engine": "ga",  # Оптимизатор: "ga", "array", "islands", "annealing", "multilevel"
+    "anneal_moves": 0,  # Ходов отжига за эпоху (0 - 10 на компонент)
+    "multilevel_threshold": 100,  # Огрублять, пока компонентов больше этого числа
+    "multilevel_refine_moves": 0,  # Ходов отжига за эпоху на уровне (0 - anneal_moves)
+    "analytical_fraction": 0.1,  # Доля начальной популяции из квадратичного размещения
+    "seeding_fraction": 0.25,  # Доля начальной популяции, раскладываемой упаковщиком
+    "seeding_order": "connectivity",  # Порядок упаковщика: "area" или "connectivity"
+    "batch_evaluation": True,  # Оценивать потомков одним пакетным вызовом (NumPy)
+    "backend": "python",  # Реализация оценки и операторов: "python" или "numba"
+    "mutation": "bounded",  # Мутация: "bounded" (по размерам компонента) или "uniform"
+    "repair": False,  # Переносить компоненты за платой и с пересечениями перед оценкой
+    "local_search_elites": 0,  # Сколько лучших потомков дошлифовывать (0 - без поиска)
+    "local_search_budget": 100,  # Ходов локального поиска за поколение на всех лучших
+    "collision": "brute",  # Подсчёт пересечений: "brute" (все пары) или "sweep"
+    "delta_evaluation": False,  # Пересчитывать после мутации только изменённые компоненты
+    "fitness_cache": False,  # Кэшировать оценку одинаковых геномов
+    "fitness_cache_size": 100000,  # Максимум записей в кэше (вытесняются старые)
+    "workers": 1,  # Процессов для оценки: 1 - без пула, 0 - по числу ядер
+    "parallel_chunk_size": 0,  # Геномов в одном пакете для процесса (0 - поровну)
+    "stagnation_generations": 0,  # Остановка, если лучшее не улучшалось N поколений
+    "stagnation_tolerance": 0.0,  # Минимальное улучшение, которое не считается стагнацией
+    "target_fitness": None,  # Остановка при достижении значения (штрафы от 1000)
+    "time_budget": None,  # Ограничение времени запуска в секундах
+    "checkpoint_path": None,  # Файл контрольной точки (.npz); None - без сохранения
+    "checkpoint_every": 0,  # Сохранять каждые N поколений (0 - не по поколениям)
+    "checkpoint_interval": 0,  # Сохранять раз в T секунд (0 - не по времени)
+    "islands": 4,  # Количество островов (популяций) в островной модели
+    "migration_interval": 10,  # Раз в сколько поколений острова обмениваются особями
+    "migrants": 2,  # Сколько лучших особей отправляется каждому соседу
+    "topology": "ring",  # Связи между островами: "ring" или "torus"
     "visualization_steps": [i for i in range(0, 100 + 10, 10)],
+    "snapshot_capacity": 100,  # Снимков поколений в памяти; более старые - на диске
+    "snapshot_path": None,  # Файл вытесненных снимков (None - временный файл)
+    "live_plot_series": ["best", "mean"],  # Из "best", "mean", "worst", "diversity"
     "components": [],  # Список компонентов в формате {"width": 1, "height": 1 }
     "connections": [],  # Список соединений в формате [ 0, 1 ]
     "fitness": [],  # Список значений функции приспособленности, нужно для графиков
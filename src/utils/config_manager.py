@@ -1,21 +1,80 @@
+import copy
 import json
 import os
+import tempfile
 
 from src.utils.base_config import base_config
+from src.utils.file_mode import replacement_mode
 
 CONFIGS_DIR = os.path.join("src", "configs")
+CONFIGS_INDEX = os.path.join("src", "configs_index.json")  # Индекс имён по файлам
 os.makedirs(CONFIGS_DIR, exist_ok=True)
 
+DEFAULT_KEYS = (
+    "board_width",
+    "board_height",
+    "population_size",
+    "generations",
+    "visualization_steps",
+    "cxpb",
+    "mutpb",
+    "components",
+    "connections",
+)  # Параметры новой конфигурации по умолчанию
+
+
+def _write_json(path: str, data) -> None:
+    """Атомарная запись JSON: временный файл, fsync и переименование; права
+    файла сохраняются"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        os.fchmod(fd, replacement_mode(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _read_json(path: str) -> dict | None:
+    """Содержимое файла конфигураций или None для битого файла"""
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (json.JSONDecodeError, UnicodeDecodeError, PermissionError):
+        return None
+    return data if isinstance(data, dict) else None
+
 
 class ConfigManager:
+    """Конфигурации из папки CONFIGS_DIR, по файлу на конфигурацию
+
+    Индекс (имя файла -> mtime, размер и имена конфигураций) хранится в
+    CONFIGS_INDEX, поэтому список имён строится без чтения файлов: заново
+    разбираются только новые и изменённые файлы. Тела конфигураций читаются
+    при первом обращении и кэшируются до изменения файла
+    """
+
     def __init__(self):
-        self.configs = {}
+        self.files = {}  # Имя файла -> {"mtime": ..., "size": ..., "names": [...]}
+        self.index = {}  # Имя конфигурации -> имя файла
+        self.configs = {}  # Загруженные конфигурации: имя -> конфиг
+        self.loaded = {}  # Имя файла -> (mtime, размер) загруженных тел
         self.load_configs()
 
+    @staticmethod
+    def _stamp(stat: os.stat_result) -> tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
     def _get_next_config_number(self):
         """Находит минимальный свободный номер для нового конфига"""
         existing = []
-        for f in os.listdir(CONFIGS_DIR):
+        for f in self.files:
             if f.startswith("config") and f.endswith(".json"):
                 try:
                     num = int(f[6:-5])  # Извлекаем число между "config" и ".json"
@@ -27,32 +86,34 @@ class ConfigManager:
     def add_config(self, name, config=None):
         """Добавляет новую конфигурацию в отдельный файл"""
         config_number = self._get_next_config_number()
-        filename = os.path.join(CONFIGS_DIR, f"config{config_number}.json")
-
-        default_config = {
-            "board_width": base_config.BOARD_WIDTH,
-            "board_height": base_config.BOARD_HEIGHT,
-            "population_size": base_config.POPULATION_SIZE,
-            "generations": base_config.GENERATIONS,
-            "visualization_steps": base_config.VISUALIZATION_STEPS,
-            "cxpb": base_config.CXPB,
-            "mutpb": base_config.MUTPB,
-            "components": base_config.COMPONENTS,
-            "connections": base_config.CONNECTIONS,
-        }
-
-        self.configs[name] = default_config if config is None else config
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump({name: self.configs[name]}, f, ensure_ascii=False, indent=4)
-        self.load_configs()
+        filename = f"config{config_number}.json"
+        if config is None:
+            config = copy.deepcopy({key: base_config[key] for key in DEFAULT_KEYS})
+        self._write(filename, {name: config})
+        self.save_index()
 
     def get_config(self, name):
         """Возвращает конфигурацию по имени, включая компоненты и соединения"""
+        filename = self.index.get(name)
+        if filename is None:
+            return None
+        path = os.path.join(CONFIGS_DIR, filename)
+        try:
+            stamp = self._stamp(os.stat(path))
+        except FileNotFoundError:  # Файл удалён в обход менеджера
+            self._forget(filename)
+            self._rebuild_index()
+            self.save_index()
+            return None
+        if self.loaded.get(filename) != stamp:
+            self._parse(filename, stamp)
+            self._rebuild_index()
+            self.save_index()
         return self.configs.get(name)
 
     def get_config_names(self):
-        """Возвращает список имен всех конфигураций"""
-        return list(self.configs.keys())
+        """Возвращает список имен всех конфигураций (только по индексу)"""
+        return list(self.index)
 
     def save_configs(self):
         """Сохраняет все конфигурации (для обратной совместимости)"""
@@ -60,54 +121,104 @@ class ConfigManager:
         pass
 
     def load_configs(self):
-        """Загружает все конфигурации из папки"""
-        self.configs = {}
-        for filename in os.listdir(CONFIGS_DIR):
-            if filename.endswith(".json"):
-                try:
-                    with open(
-                        os.path.join(CONFIGS_DIR, filename), "r", encoding="utf-8"
-                    ) as f:
-                        data = json.load(f)
-                        self.configs.update(data)
-                except json.JSONDecodeError:
-                    continue  # Пропускаем битые JSON-файлы
+        """Сверяет индекс с папкой: разбирает только новые и изменённые файлы"""
+        saved = {}
+        if os.path.exists(CONFIGS_INDEX):
+            saved = _read_json(CONFIGS_INDEX) or {}
+        files = {}
+        with os.scandir(CONFIGS_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    files[entry.name] = self._stamp(entry.stat())
+
+        changed = set(self.files) != set(files)
+        for filename in set(self.files) - set(files):
+            self._forget(filename)
+        for filename in sorted(files):
+            stamp = files[filename]
+            entry = self.files.get(filename) or saved.get(filename)
+            if entry and (entry.get("mtime"), entry.get("size")) == stamp:
+                self.files[filename] = entry
+            else:
+                self._parse(filename, stamp)
+                changed = True
+        self._rebuild_index()
+        if changed or saved.keys() != self.files.keys():
+            self.save_index()
+
+    def save_index(self):
+        """Сохраняет индекс рядом с папкой конфигураций"""
+        _write_json(CONFIGS_INDEX, self.files)
 
     def update_config(self, name, new_config):
         """Обновляет существующую конфигурацию"""
-        if name in self.configs:
-            self.configs[name].update(new_config)
-            # Находим и обновляем соответствующий файл
-            for filename in os.listdir(CONFIGS_DIR):
-                filepath = os.path.join(CONFIGS_DIR, filename)
-                try:
-                    with open(filepath, "r+", encoding="utf-8") as f:
-                        data = json.load(f)
-                        if name in data:
-                            data[name] = self.configs[name]
-                            f.seek(0)
-                            f.truncate()
-                            json.dump(data, f, ensure_ascii=False, indent=4)
-                except (json.JSONDecodeError, PermissionError):
-                    continue
+        config = self.get_config(name)
+        if config is None:
+            return
+        config.update(new_config)
+        filename = self.index[name]
+        data = {
+            config_name: self.configs[config_name]
+            for config_name in self.files[filename]["names"]
+        }
+        self._write(filename, data)
+        self.save_index()
 
     def delete_config(self, name):
-        """Удаляет конфигурацию и соответствующий файл"""
-        files_to_delete = []
-        for filename in os.listdir(CONFIGS_DIR):
-            filepath = os.path.join(CONFIGS_DIR, filename)
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if name in data:
-                        files_to_delete.append(filepath)
-            except (json.JSONDecodeError, PermissionError):
-                continue
-
-        # Удаление файлов после закрытия всех дескрипторов
-        for filepath in files_to_delete:
-            try:
-                os.remove(filepath)
-            except PermissionError:
-                continue
-        self.load_configs()
+        """Удаляет конфигурацию; файл удаляется, если в нём не осталось других"""
+        if self.get_config(name) is None:
+            return
+        filename = self.index[name]
+        names = [other for other in self.files[filename]["names"] if other != name]
+        try:
+            if names:
+                self._write(filename, {other: self.configs[other] for other in names})
+            else:
+                os.remove(os.path.join(CONFIGS_DIR, filename))
+                self._forget(filename)
+                self._rebuild_index()
+        except PermissionError:
+            return
+        self.save_index()
+
+    def _parse(self, filename, stamp):
+        """Читает файл и обновляет его запись в индексе и кэш конфигураций"""
+        self._forget(filename)
+        data = _read_json(os.path.join(CONFIGS_DIR, filename)) or {}
+        self.files[filename] = {
+            "mtime": stamp[0],
+            "size": stamp[1],
+            "names": list(data),
+        }
+        self.configs.update(data)
+        self.loaded[filename] = stamp
+
+    def _write(self, filename, data):
+        """Атомарно записывает файл и обновляет индекс без повторного чтения"""
+        path = os.path.join(CONFIGS_DIR, filename)
+        _write_json(path, data)
+        stamp = self._stamp(os.stat(path))
+        self._forget(filename)
+        self.files[filename] = {
+            "mtime": stamp[0],
+            "size": stamp[1],
+            "names": list(data),
+        }
+        self.configs.update(data)
+        self.loaded[filename] = stamp
+        self._rebuild_index()
+
+    def _forget(self, filename):
+        """Убирает файл из индекса и его конфигурации из кэша"""
+        entry = self.files.pop(filename, None)
+        self.loaded.pop(filename, None)
+        for name in entry["names"] if entry else ():
+            if self.index.get(name) == filename:
+                self.configs.pop(name, None)
+
+    def _rebuild_index(self):
+        """Имя конфигурации -> файл; при совпадении имён побеждает последний"""
+        self.index = {}
+        for filename in sorted(self.files):
+            for name in self.files[filename]["names"]:
+                self.index[name] = filename
@@ -0,0 +1,23 @@
+import functools
+import os
+import stat
+
+
+@functools.cache
+def _umask() -> int:
+    """umask процесса: узнать его можно только установкой, поэтому один раз"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def replacement_mode(path: str) -> int:
+    """Права для временного файла, которым атомарно заменяется path
+
+    mkstemp создаёт файл с правами 0600, а os.replace переносит их на path;
+    поэтому берутся права заменяемого файла, а для нового - 0666 с учётом umask
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_umask()
@@ -0,0 +1,215 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from src.utils.base_config import base_config
+
+BATCH_SIZE = 500  # Строк траектории в одной пакетной вставке
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    config_name TEXT,
+    config_hash TEXT NOT NULL,
+    seed INTEGER,
+    engine TEXT NOT NULL,
+    started REAL NOT NULL,
+    elapsed REAL,
+    best_fitness REAL,
+    generations INTEGER,
+    stop_reason TEXT,
+    best_genome BLOB,
+    stats TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_config ON runs (config_hash, started);
+CREATE INDEX IF NOT EXISTS runs_by_name ON runs (config_name, started);
+CREATE INDEX IF NOT EXISTS runs_by_engine ON runs (engine, started);
+CREATE TABLE IF NOT EXISTS trajectory (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    generation INTEGER NOT NULL,
+    best REAL NOT NULL,
+    mean REAL,
+    PRIMARY KEY (run_id, generation)
+) WITHOUT ROWID;
+"""
+
+RUN_COLUMNS = (
+    "id",
+    "config_name",
+    "config_hash",
+    "seed",
+    "engine",
+    "started",
+    "elapsed",
+    "best_fitness",
+    "generations",
+    "stop_reason",
+)
+
+
+def config_hash(config: dict) -> str:
+    """Хэш конфига без сида: запуски одной задачи с разными сидами сравнимы"""
+    payload = {key: value for key, value in config.items() if key != "seed"}
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class RunStore:
+    """База запусков на sqlite3: метаданные, траектории и лучшие раскладки
+
+    Соединение общее для потоков (запись идёт из фонового потока ГА, чтение -
+    из интерфейса), поэтому обращения к нему защищены блокировкой
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")  # Чтение не ждёт запись
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    def start_run(
+        self, config: dict, engine: str, config_name: str | None = None
+    ) -> "RunRecorder":
+        """Новая запись о запуске; точки траектории пишет возвращённый RunRecorder"""
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (config_name, config_hash, seed, engine, started)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    config_name,
+                    config_hash(config),
+                    config.get("seed", base_config["seed"]),
+                    engine,
+                    time.time(),
+                ),
+            )
+        return RunRecorder(self, cursor.lastrowid)
+
+    def runs(
+        self,
+        config_name: str | None = None,
+        config_hash: str | None = None,
+        engine: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Метаданные запусков, новые первыми; фильтры идут по индексам"""
+        conditions, params = [], []
+        for column, value in (
+            ("config_name", config_name),
+            ("config_hash", config_hash),
+            ("engine", engine),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        query = f"SELECT {', '.join(RUN_COLUMNS)} FROM runs"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY started DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self.lock:
+            rows = self.connection.execute(query, params).fetchall()
+        return [dict(zip(RUN_COLUMNS, row)) for row in rows]
+
+    def trajectories(self, run_ids: list[int]) -> dict[int, dict]:
+        """Траектории нескольких запусков одним запросом по первичному ключу:
+        {run_id: {"generation": ..., "best": ..., "mean": ...}} (массивы numpy)"""
+        if not run_ids:
+            return {}
+        placeholders = ", ".join("?" * len(run_ids))
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT run_id, generation, best, mean FROM trajectory"
+                f" WHERE run_id IN ({placeholders}) ORDER BY run_id, generation",
+                list(run_ids),
+            ).fetchall()
+        result = {
+            run_id: {"generation": [], "best": [], "mean": []} for run_id in run_ids
+        }
+        for run_id, generation, best, mean in rows:
+            points = result[run_id]
+            points["generation"].append(generation)
+            points["best"].append(best)
+            points["mean"].append(np.nan if mean is None else mean)
+        return {
+            run_id: {key: np.array(values) for key, values in points.items()}
+            for run_id, points in result.items()
+        }
+
+    def best_genome(self, run_id: int) -> np.ndarray | None:
+        """Лучшая раскладка запуска (N x 3) или None"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT best_genome FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.int32).reshape(-1, 3)
+
+
+class RunRecorder:
+    """Запись одного запуска: точки траектории копятся в памяти и вставляются
+    пакетами по BATCH_SIZE, чтобы не замедлять цикл поколений"""
+
+    def __init__(self, store: RunStore, run_id: int):
+        self.store = store
+        self.run_id = run_id
+        self.pending = []
+
+    def record(
+        self,
+        generation: int,
+        best: float,
+        mean: float | None = None,
+        worst: float | None = None,
+        diversity: float | None = None,
+    ) -> None:
+        """Точка траектории; worst и diversity нужны только живому графику
+        и в базу не пишутся"""
+        mean = None if mean is None else float(mean)
+        self.pending.append((self.run_id, int(generation), float(best), mean))
+        if len(self.pending) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        with self.store.lock, self.store.connection:
+            self.store.connection.executemany(
+                "INSERT OR REPLACE INTO trajectory (run_id, generation, best, mean)"
+                " VALUES (?, ?, ?, ?)",
+                self.pending,
+            )
+        self.pending = []
+
+    def finish(self, population: list, run_stats: dict, elapsed: float) -> None:
+        """Итог запуска: лучшая особь, время и статистика"""
+        self.flush()
+        best = min(population, key=lambda ind: ind.fitness.values[0])
+        genome = np.asarray(best, dtype=np.int32).tobytes()
+        with self.store.lock, self.store.connection:
+            self.store.connection.execute(
+                "UPDATE runs SET elapsed = ?, best_fitness = ?, generations = ?,"
+                " stop_reason = ?, best_genome = ?, stats = ? WHERE id = ?",
+                (
+                    elapsed,
+                    best.fitness.values[0],
+                    run_stats.get("generations"),
+                    run_stats.get("stop_reason"),
+                    genome,
+                    json.dumps(run_stats, default=float),
+                    self.run_id,
+                ),
+            )